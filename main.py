@@ -98,8 +98,11 @@ class SmartTrader:
                 self.config = carregar_config()
                 progress.update(advance=1)
 
-                # 2. Inicializa GerenciadorLog (já inicializa automaticamente no __init__)
+                # 2. Inicializa GerenciadorLog (threads de escrita iniciadas em iniciar())
                 self.gerenciador_log = GerenciadorLog(base_path="logs")
+                if not self.gerenciador_log.iniciar():
+                    print("[SmartTrader] ERRO: Falha ao iniciar GerenciadorLog")
+                    return False
                 progress.update(advance=1)
 
                 # 3. Inicializa GerenciadorBanco
@@ -746,10 +749,10 @@ class SmartTrader:
                             par=par
                         )
                         
-                        if validacao.get("valido"):
-                            direcao = validacao.get("direcao")
-                            contagem = validacao.get("contagem", 0)
-                            detalhes = validacao.get("detalhes", {})
+                        if validacao.valido:
+                            direcao = validacao.direcao
+                            contagem = validacao.contagem
+                            detalhes = validacao.detalhes
                             
                             # Calcula SL e TP se houver preço de entrada
                             sl = None
@@ -1282,6 +1285,10 @@ class SmartTrader:
             if logger:
                 logger.info("[SmartTrader] Sistema finalizado com sucesso")
 
+            # Por último: drena a fila de logs para o disco
+            if self.gerenciador_log:
+                self.gerenciador_log.finalizar()
+
             print("[SmartTrader] Sistema finalizado")
 
         except Exception as e:
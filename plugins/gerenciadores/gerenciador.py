@@ -22,6 +22,9 @@ class GerenciadorBase(ABC):
         _em_execucao (bool): Flag indicando se o gerenciador está em execução
     """
 
+    # Permite que subclasses declarem __slots__ (as demais mantêm __dict__)
+    __slots__ = ("_inicializado", "_em_execucao", "_timestamp_inicio")
+
     GERENCIADOR_NAME: str = "GerenciadorBase"
 
     def __init__(self):
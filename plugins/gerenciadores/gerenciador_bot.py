@@ -8,9 +8,244 @@ Controla execução de trades com:
 - Monitoramento de posições
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple
+from functools import lru_cache
+import logging
 from plugins.gerenciadores.gerenciador import GerenciadorBase
 from datetime import datetime
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Fallback se numba não estiver disponível: executa em Python puro
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda funcao: funcao
+
+
+# Os 8 indicadores da contagem 6/8 (a posição define o bit na máscara de sinais)
+_INDICADORES = (
+    "ichimoku",
+    "supertrend",
+    "bollinger",
+    "volume",
+    "ema",
+    "macd",
+    "rsi",
+    "vwap",
+)
+_TOTAL_INDICADORES = len(_INDICADORES)
+_BIT_INDICADOR = {nome: 1 << i for i, nome in enumerate(_INDICADORES)}
+
+# Mapeamento de nomes de plugins para indicadores
+_PLUGIN_TO_INDICATOR = {
+    "PluginIchimoku": "ichimoku",
+    "PluginSupertrend": "supertrend",
+    "PluginBollinger": "bollinger",
+    "PluginVolume": "volume",
+    "PluginEma": "ema",
+    "PluginMacd": "macd",
+    "PluginRsi": "rsi",
+    "PluginVwap": "vwap",
+}
+
+# Cache de chaves de plugin já normalizadas para nome de indicador
+_CHAVES_NORMALIZADAS: Dict[str, str] = {}
+
+def _normalizar_chave(key: str) -> str:
+    """
+    Converte a chave de um plugin no nome do indicador correspondente.
+    
+    O conjunto de chaves é pequeno e fechado, então o custo de normalização
+    (lower/replace) só é pago na primeira vez que cada chave aparece.
+    """
+    nome = _CHAVES_NORMALIZADAS.get(key)
+    if nome is None:
+        nome = _PLUGIN_TO_INDICATOR.get(key) or key.lower().replace("plugin", "")
+        _CHAVES_NORMALIZADAS[key] = nome
+    return nome
+
+
+_MIN_CONSENSO = 6
+
+# Códigos de direção do kernel de consenso (0 = sem direção)
+_DIRECOES = (None, "LONG", "SHORT")
+
+# Motivos pré-formatados, indexados pelas contagens (0..8)
+_MOTIVO_LONG = tuple(f"{n}/8 indicadores LONG" for n in range(_TOTAL_INDICADORES + 1))
+_MOTIVO_SHORT = tuple(f"{n}/8 indicadores SHORT" for n in range(_TOTAL_INDICADORES + 1))
+_MOTIVO_AGUARDA_LONG = f"Empate: 5/8 LONG com {_TOTAL_INDICADORES - 5} neutros. Aguardando 6/8"
+_MOTIVO_AGUARDA_SHORT = f"Empate: 5/8 SHORT com {_TOTAL_INDICADORES - 5} neutros. Aguardando 6/8"
+_MOTIVO_EMPATE = tuple(
+    f"Empate exato: {n}L/{n}S. Reduzindo oscilações falsas" for n in range(_TOTAL_INDICADORES + 1)
+)
+_MOTIVO_INSUF = tuple(
+    tuple(
+        f"Insufficiente: {l}L/{s}S/{_TOTAL_INDICADORES - l - s}N"
+        for s in range(_TOTAL_INDICADORES + 1)
+    )
+    for l in range(_TOTAL_INDICADORES + 1)
+)
+
+
+@njit(cache=True)
+def _consenso_nb(mascara):
+    """
+    Avalia o consenso 6/8 sobre a máscara empacotada em 16 bits.
+    
+    A máscara traz os sinais LONG no byte alto e os SHORT no byte baixo.
+    A contagem de bits é feita em SWAR nos dois bytes ao mesmo tempo e a
+    direção é obtida sem desvios. Compilado com numba quando disponível.
+    
+    Returns:
+        tuple: (valido, codigo_direcao, long_count, short_count)
+    """
+    x = mascara - ((mascara >> 1) & 0x5555)
+    x = (x & 0x3333) + ((x >> 2) & 0x3333)
+    x = (x + (x >> 4)) & 0x0F0F
+    long_count = x >> 8
+    short_count = x & 0xFF
+    
+    consenso_long = int(long_count >= _MIN_CONSENSO)
+    consenso_short = int(short_count >= _MIN_CONSENSO)
+    codigo_direcao = consenso_long | ((consenso_short & (consenso_long ^ 1)) << 1)
+    return codigo_direcao != 0, codigo_direcao, long_count, short_count
+
+
+def _decidir_contagens(long_count: int, short_count: int) -> Tuple[bool, Optional[str], str, int, int]:
+    """
+    Decide a entrada 6/8 direto das contagens (caminho raro).
+    
+    Usado quando há indicadores fora dos 8 conhecidos: eles contam como
+    no cálculo original, então as contagens podem passar de 8 e não cabem
+    na máscara nem nas tabelas de motivos.
+    
+    Args:
+        long_count: Indicadores em LONG
+        short_count: Indicadores em SHORT
+        
+    Returns:
+        tuple: (valido, direcao, motivo, long_count, short_count)
+    """
+    neutros = _TOTAL_INDICADORES - long_count - short_count
+    if long_count >= _MIN_CONSENSO:
+        return True, "LONG", f"{long_count}/8 indicadores LONG", long_count, short_count
+    if short_count >= _MIN_CONSENSO:
+        return True, "SHORT", f"{short_count}/8 indicadores SHORT", long_count, short_count
+    if long_count == 5 and short_count == 0 and neutros >= 3:
+        motivo = f"Empate: {long_count}/8 LONG com {neutros} neutros. Aguardando 6/8"
+    elif short_count == 5 and long_count == 0 and neutros >= 3:
+        motivo = f"Empate: {short_count}/8 SHORT com {neutros} neutros. Aguardando 6/8"
+    elif long_count == short_count and long_count > 0:
+        motivo = f"Empate exato: {long_count}L/{short_count}S. Reduzindo oscilações falsas"
+    else:
+        motivo = f"Insufficiente: {long_count}L/{short_count}S/{neutros}N"
+    return False, None, motivo, long_count, short_count
+
+
+@lru_cache(maxsize=256)
+def _decidir(mascara: int, extra_long: int = 0, extra_short: int = 0) -> Tuple[bool, Optional[str], str, int, int]:
+    """
+    Decide a entrada 6/8 a partir da máscara de sinais.
+    
+    Função pura: indicadores raramente mudam a cada ciclo, então a mesma
+    máscara se repete e o resultado vem do cache.
+    
+    Args:
+        mascara: Máscara de 16 bits (LONG << 8 | SHORT)
+        extra_long: Sinais LONG de indicadores fora dos 8 conhecidos
+        extra_short: Sinais SHORT de indicadores fora dos 8 conhecidos
+        
+    Returns:
+        tuple: (valido, direcao, motivo, long_count, short_count)
+    """
+    valido, codigo_direcao, long_count, short_count = _consenso_nb(mascara)
+    long_count = int(long_count)
+    short_count = int(short_count)
+    if extra_long or extra_short:
+        return _decidir_contagens(long_count + extra_long, short_count + extra_short)
+    neutros = _TOTAL_INDICADORES - long_count - short_count
+    
+    # Validação 6/8 com tratamento de empates (motivos pré-formatados)
+    if valido:
+        if codigo_direcao == 1:
+            return True, "LONG", _MOTIVO_LONG[long_count], long_count, short_count
+        return True, "SHORT", _MOTIVO_SHORT[short_count], long_count, short_count
+    
+    if long_count == 5 and short_count == 0 and neutros >= 3:
+        # 5/8 com neutros: aguarda confirmação (6/8 necessário)
+        motivo = _MOTIVO_AGUARDA_LONG
+    elif short_count == 5 and long_count == 0 and neutros >= 3:
+        # 5/8 com neutros: aguarda confirmação (6/8 necessário)
+        motivo = _MOTIVO_AGUARDA_SHORT
+    elif long_count == short_count and long_count > 0:
+        # Empate exato (ex: 4L/4S): Inválido para reduzir oscilações falsas
+        motivo = _MOTIVO_EMPATE[long_count]
+    else:
+        # Menos de 6/8: Inválido
+        motivo = _MOTIVO_INSUF[long_count][short_count]
+    return False, None, motivo, long_count, short_count
+
+
+# Alvo de risco/retorno (R:R = 1:2.3)
+_RR_TARGET = 2.3
+
+# (alavancagem, risco_percentual) para pares sem configuração própria
+_RISCO_PADRAO = (3, 1.0)
+
+
+@njit(cache=True)
+def _calc_risco_nb(preco_entrada, sl_nivel, sinal, rr):
+    """
+    Calcula TP e R:R sem desvios de direção.
+    
+    Args:
+        preco_entrada: Preço de entrada
+        sl_nivel: Nível de stop loss
+        sinal: +1.0 para LONG, -1.0 para SHORT
+        rr: Alvo de risco/retorno
+        
+    Returns:
+        tuple: (tp_nivel, rr_ratio, distancia_sl, distancia_tp)
+    """
+    distancia_sl = abs(preco_entrada - sl_nivel)
+    tp_nivel = preco_entrada + sinal * distancia_sl * rr
+    distancia_tp = sinal * (tp_nivel - preco_entrada)
+    rr_ratio = distancia_tp / distancia_sl if distancia_sl > 0 else 0.0
+    return tp_nivel, rr_ratio, distancia_sl, distancia_tp
+
+
+@lru_cache(maxsize=256)
+def _nomes_com_sinal(mascara: int) -> Tuple[str, ...]:
+    """Nomes (em maiúsculas) dos indicadores presentes na máscara de 8 bits."""
+    return tuple(nome.upper() for i, nome in enumerate(_INDICADORES) if mascara >> i & 1)
+
+
+
+class ResultadoEntrada(NamedTuple):
+    """
+    Resultado da validação de entrada 6/8.
+    
+    Attributes:
+        valido (bool): Se há consenso para entrada
+        direcao (str | None): "LONG", "SHORT" ou None
+        contagem_long (int): Indicadores em LONG
+        contagem_short (int): Indicadores em SHORT
+        contagem_neutros (int): Indicadores sem sinal
+        contagem (int): Maior contagem entre LONG e SHORT
+        motivo (str | None): Explicação da decisão
+        detalhes (dict): Sinais por indicador (preenchido apenas quando válido)
+    """
+    valido: bool
+    direcao: Optional[str]
+    contagem_long: int
+    contagem_short: int
+    contagem_neutros: int
+    contagem: int
+    motivo: Optional[str]
+    detalhes: Dict[str, Any]
 
 
 class GerenciadorBot(GerenciadorBase):
@@ -32,6 +267,18 @@ class GerenciadorBot(GerenciadorBase):
         resultados_indicadores (dict): Resultados agregados dos indicadores
     """
 
+    # Sem __dict__ por instância: atributos viram slots de acesso direto
+    __slots__ = (
+        "gerenciador_log",
+        "config",
+        "posicoes_abertas",
+        "resultados_indicadores",
+        "logger",
+        "_log_sinal",
+        "_par_risk",
+        "_chaves_desconhecidas",
+    )
+
     GERENCIADOR_NAME: str = "GerenciadorBot"
 
     def __init__(
@@ -54,6 +301,15 @@ class GerenciadorBot(GerenciadorBase):
         self.resultados_indicadores: Dict[str, Any] = {}
         
         self.logger = None
+        
+        # log_sinal resolvido uma única vez em inicializar()
+        self._log_sinal = None
+        
+        # (alavancagem, risco_percentual) por par, achatado a partir do config
+        self._par_risk: Dict[str, Tuple[int, float]] = self._montar_risco_pares()
+        
+        # Chaves fora dos 8 indicadores já reportadas no log (aviso uma vez por chave)
+        self._chaves_desconhecidas: set = set()
 
     def inicializar(self) -> bool:
         """
@@ -67,6 +323,9 @@ class GerenciadorBot(GerenciadorBase):
                 self.logger = self.gerenciador_log.get_logger(
                     self.GERENCIADOR_NAME, "system"
                 )
+                self._log_sinal = getattr(self.gerenciador_log, "log_sinal", None)
+            
+            self._par_risk = self._montar_risco_pares()
             
             if self.logger:
                 self.logger.debug(
@@ -83,7 +342,83 @@ class GerenciadorBot(GerenciadorBase):
                 )
             return False
 
-    def validar_entrada(self, resultados_indicadores: Dict[str, Any], par: Optional[str] = None) -> Dict[str, Any]:
+    def _montar_risco_pares(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Achata config["pares_config"] em {par: (alavancagem, risco_percentual)}.
+        
+        Returns:
+            dict: Parâmetros de risco por par (pares ausentes usam _RISCO_PADRAO)
+        """
+        return {
+            par: (
+                cfg.get("alavancagem", _RISCO_PADRAO[0]),
+                cfg.get("risco_percentual", _RISCO_PADRAO[1]),  # % do capital
+            )
+            for par, cfg in self.config.get("pares_config", {}).items()
+        }
+
+    @staticmethod
+    def _achatar_resultados(
+        resultados_indicadores: Dict[str, Any], par: Optional[str]
+    ) -> List[Tuple[str, bool, bool]]:
+        """
+        Achata os resultados em uma lista de (indicador, long, short).
+        
+        Percorre plugin → par → timeframe uma única vez. O formato é decidido
+        por entrada (o dict pode misturar resultados de plugins e de
+        indicadores): entradas de plugin têm os sinais de todos os timeframes
+        do par agregados por OR; entradas que não são dict (ex: rótulos
+        "par"/"timeframe" ou plugin sem resultado) são neutras e ignoradas.
+        
+        Args:
+            resultados_indicadores: Dict de plugins e/ou dict de indicadores
+            par: Par cujos sinais devem ser extraídos (formato de plugins)
+            
+        Returns:
+            list: Tuplas (nome_indicador, sinal_long, sinal_short)
+        """
+        sinais = []
+        adicionar = sinais.append
+        for key, value in resultados_indicadores.items():
+            if not isinstance(value, dict):
+                continue
+            
+            if "dados" in value:
+                # É resultado de plugin
+                dados_plugin = value["dados"]
+                sinal_long = False
+                sinal_short = False
+                if par and isinstance(dados_plugin, dict) and par in dados_plugin:
+                    for tf_data in dados_plugin[par].values():
+                        if isinstance(tf_data, dict):
+                            get_sinal = tf_data.get
+                            sinal_long = sinal_long or bool(get_sinal("long", False))
+                            sinal_short = sinal_short or bool(get_sinal("short", False))
+                adicionar((_normalizar_chave(key), sinal_long, sinal_short))
+            else:
+                # É resultado direto de indicador
+                get_sinal = value.get
+                adicionar((key, bool(get_sinal("long", False)), bool(get_sinal("short", False))))
+        return sinais
+
+    def _avisar_chave_desconhecida(self, chave: str):
+        """
+        Registra (uma vez por chave) um indicador fora dos 8 da máscara 6/8
+        (ele ainda conta para o consenso, por fora da máscara).
+        
+        Args:
+            chave: Chave do indicador/plugin como veio nos resultados
+        """
+        if chave in self._chaves_desconhecidas:
+            return
+        self._chaves_desconhecidas.add(chave)
+        if self.logger:
+            self.logger.warning(
+                f"[{self.GERENCIADOR_NAME}] Indicador '{chave}' não faz parte dos "
+                f"{_TOTAL_INDICADORES} da contagem 6/8 ({', '.join(_INDICADORES)})"
+            )
+
+    def validar_entrada(self, resultados_indicadores: Dict[str, Any], par: Optional[str] = None) -> ResultadoEntrada:
         """
         Valida condições de entrada baseado na contagem 6/8.
         
@@ -92,110 +427,51 @@ class GerenciadorBot(GerenciadorBase):
             par: Nome do par sendo validado (opcional, para logs)
             
         Returns:
-            dict: {
-                "valido": bool,
-                "direcao": "LONG" | "SHORT" | None,
-                "contagem": int,
-                "detalhes": dict
-            }
+            ResultadoEntrada: valido, direcao, contagens, motivo e detalhes
         """
         try:
             if not resultados_indicadores:
-                return {"valido": False, "direcao": None, "contagem": 0, "detalhes": {}}
-
-            # Contagem de indicadores por direção
-            long_count = 0
-            short_count = 0
-            detalhes = {}
-            indicadores_com_sinal = []
-
-            # Mapeamento dos 8 indicadores
-            indicadores = [
-                "ichimoku",
-                "supertrend",
-                "bollinger",
-                "volume",
-                "ema",
-                "macd",
-                "rsi",
-                "vwap",
-            ]
-            
-            # Mapeamento de nomes de plugins para indicadores
-            plugin_to_indicator = {
-                "PluginIchimoku": "ichimoku",
-                "PluginSupertrend": "supertrend",
-                "PluginBollinger": "bollinger",
-                "PluginVolume": "volume",
-                "PluginEma": "ema",
-                "PluginMacd": "macd",
-                "PluginRsi": "rsi",
-                "PluginVwap": "vwap",
-            }
+                return ResultadoEntrada(False, None, 0, 0, 0, 0, None, {})
 
-            # Processa resultados (pode vir como dict de plugins ou dict de indicadores)
-            for key, value in resultados_indicadores.items():
-                # Se for um plugin, extrai os dados
-                if isinstance(value, dict) and "dados" in value:
-                    # É resultado de plugin
-                    dados_plugin = value.get("dados", {})
-                    indicador_nome = plugin_to_indicator.get(key, key.lower().replace("plugin", ""))
-                    
-                    # Procura sinais no par específico
-                    if par and par in dados_plugin:
-                        par_data = dados_plugin[par]
-                        # Conta sinais por timeframe
-                        for tf, tf_data in par_data.items():
-                            if isinstance(tf_data, dict):
-                                if tf_data.get("long", False):
-                                    long_count += 1
-                                    if indicador_nome not in indicadores_com_sinal:
-                                        indicadores_com_sinal.append(indicador_nome.upper())
-                                if tf_data.get("short", False):
-                                    short_count += 1
-                                    if indicador_nome not in indicadores_com_sinal:
-                                        indicadores_com_sinal.append(indicador_nome.upper())
-                else:
-                    # É resultado direto de indicador
-                    resultado = value if isinstance(value, dict) else {}
-                    sinal_long = resultado.get("long", False)
-                    sinal_short = resultado.get("short", False)
-                    
-                    if sinal_long:
-                        long_count += 1
-                        indicadores_com_sinal.append(key.upper())
-                    if sinal_short:
-                        short_count += 1
-                        if key.upper() not in indicadores_com_sinal:
-                            indicadores_com_sinal.append(key.upper())
-                    
-                    detalhes[key] = {
-                        "long": sinal_long,
-                        "short": sinal_short,
-                    }
-
-            # Conta indicadores neutros (sem sinal claro)
-            total_indicadores = len(indicadores)
-            neutros = total_indicadores - long_count - short_count
-            
-            # Validação 6/8 com tratamento de empates
-            valido = False
-            direcao = None
-            motivo = None
-            
-            if long_count >= 6:
-                valido = True
-                direcao = "LONG"
-                motivo = f"{long_count}/8 indicadores LONG"
-            elif short_count >= 6:
-                valido = True
-                direcao = "SHORT"
-                motivo = f"{short_count}/8 indicadores SHORT"
+            # Referências locais (evita LOAD_ATTR/LOAD_GLOBAL repetidos)
+            logger = self.logger
+            log_sinal = self._log_sinal
+            bit_indicador = _BIT_INDICADOR.get
+            normalizar = _normalizar_chave
+
+            # Reduz os sinais a duas máscaras de 8 bits (1 bit por indicador).
+            # Chaves são normalizadas antes (ex: "EMA", "PluginEma" -> "ema")
+            sinais = self._achatar_resultados(resultados_indicadores, par)
+            long_bits = 0
+            short_bits = 0
+            # Indicadores fora dos 8 contam à parte (não têm bit na máscara)
+            extra_long = 0
+            extra_short = 0
+            extras_com_sinal = []
+            for nome, sinal_long, sinal_short in sinais:
+                bit = bit_indicador(normalizar(nome), 0)
+                if not bit:
+                    self._avisar_chave_desconhecida(nome)
+                    if sinal_long or sinal_short:
+                        extra_long += sinal_long
+                        extra_short += sinal_short
+                        extras_com_sinal.append(nome.upper())
+                    continue
+                long_bits |= bit & -sinal_long
+                short_bits |= bit & -sinal_short
+
+            # Validação 6/8 (memoizada pela máscara empacotada em 16 bits + extras)
+            valido, direcao, motivo, long_count, short_count = _decidir(
+                long_bits << 8 | short_bits, extra_long, extra_short
+            )
+            neutros = _TOTAL_INDICADORES - long_count - short_count
             
             # Loga sinal se válido
-            if valido and self.gerenciador_log and par:
+            if valido and log_sinal is not None and par:
+                indicadores_com_sinal = list(_nomes_com_sinal(long_bits | short_bits))
+                indicadores_com_sinal.extend(extras_com_sinal)
                 try:
-                    self.gerenciador_log.log_sinal(
+                    log_sinal(
                         moeda=par,
                         tipo_sinal="ENTRADA",
                         direcao=direcao,
@@ -207,49 +483,49 @@ class GerenciadorBot(GerenciadorBase):
                     )
                     
                     # Log INFO adicional no formato do padrão
-                    if self.logger:
-                        self.logger.info(
-                            f"[SIGNAL] {par} — CONSENSO → {direcao} ({long_count if direcao == 'LONG' else short_count} indicadores: {', '.join(indicadores_com_sinal)})"
+                    if logger is not None and logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "[SIGNAL] %s — CONSENSO → %s (%d indicadores: %s)",
+                            par,
+                            direcao,
+                            long_count if direcao == "LONG" else short_count,
+                            ", ".join(indicadores_com_sinal),
                         )
                 except Exception as log_error:
-                    # Não interrompe o processo se houver erro no log
-                    if self.logger:
-                        self.logger.warning(
+                    # Falha no log nunca descarta um sinal válido (regra 12: trata localmente)
+                    if logger:
+                        logger.warning(
                             f"[{self.GERENCIADOR_NAME}] Erro ao logar sinal: {log_error}"
                         )
-            elif long_count == 5 and short_count == 0 and neutros >= 3:
-                # 5/8 com neutros: aguarda confirmação (6/8 necessário)
-                valido = False
-                motivo = f"Empate: {long_count}/8 LONG com {neutros} neutros. Aguardando 6/8"
-            elif short_count == 5 and long_count == 0 and neutros >= 3:
-                # 5/8 com neutros: aguarda confirmação (6/8 necessário)
-                valido = False
-                motivo = f"Empate: {short_count}/8 SHORT com {neutros} neutros. Aguardando 6/8"
-            elif long_count == short_count and long_count > 0:
-                # Empate exato (ex: 4L/4S): Inválido para reduzir oscilações falsas
-                valido = False
-                motivo = f"Empate exato: {long_count}L/{short_count}S. Reduzindo oscilações falsas"
-            else:
-                # Menos de 6/8: Inválido
-                valido = False
-                motivo = f"Insufficiente: {long_count}L/{short_count}S/{neutros}N"
 
-            resultado = {
-                "valido": valido,
-                "direcao": direcao,
-                "contagem_long": long_count,
-                "contagem_short": short_count,
-                "contagem_neutros": neutros,
-                "contagem": max(long_count, short_count),
-                "motivo": motivo,
-                "detalhes": detalhes,
-            }
+            # Detalhes só são consumidos quando há sinal válido
+            detalhes = (
+                {nome: {"long": sinal_long, "short": sinal_short} for nome, sinal_long, sinal_short in sinais}
+                if valido
+                else {}
+            )
 
-            if self.logger:
-                self.logger.debug(
-                    f"[{self.GERENCIADOR_NAME}] Validação entrada: "
-                    f"{direcao if valido else 'INVÁLIDO'} "
-                    f"({long_count}L/{short_count}S/{neutros}N) - {motivo}"
+            resultado = ResultadoEntrada(
+                valido=valido,
+                direcao=direcao,
+                contagem_long=long_count,
+                contagem_short=short_count,
+                contagem_neutros=neutros,
+                contagem=max(long_count, short_count),
+                motivo=motivo,
+                detalhes=detalhes,
+            )
+
+            # Só monta a mensagem de DEBUG se o nível estiver habilitado
+            if logger is not None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[%s] Validação entrada: %s (%dL/%dS/%dN) - %s",
+                    self.GERENCIADOR_NAME,
+                    direcao if valido else "INVÁLIDO",
+                    long_count,
+                    short_count,
+                    neutros,
+                    motivo,
                 )
 
             return resultado
@@ -259,7 +535,7 @@ class GerenciadorBot(GerenciadorBase):
                     f"[{self.GERENCIADOR_NAME}] Erro ao validar entrada: {e}",
                     exc_info=True,
                 )
-            return {"valido": False, "direcao": None, "contagem": 0, "detalhes": {}}
+            return ResultadoEntrada(False, None, 0, 0, 0, 0, None, {})
 
     def calcular_risco(
         self,
@@ -287,27 +563,14 @@ class GerenciadorBot(GerenciadorBase):
             }
         """
         try:
-            # Configurações por par (pode vir do config)
-            config_par = self.config.get("pares_config", {}).get(par, {})
-            
-            alavancagem = config_par.get("alavancagem", 3)
-            risco_percentual = config_par.get("risco_percentual", 1.0)  # % do capital
-            
-            # Cálculo SL
-            if direcao == "LONG":
-                distancia_sl = abs(preco_entrada - sl_nivel)
-                tp_nivel = preco_entrada + (distancia_sl * 2.3)  # R:R = 1:2.3
-            else:  # SHORT
-                distancia_sl = abs(sl_nivel - preco_entrada)
-                tp_nivel = preco_entrada - (distancia_sl * 2.3)
-
-            # R:R Ratio
-            if direcao == "LONG":
-                distancia_tp = tp_nivel - preco_entrada
-            else:
-                distancia_tp = preco_entrada - tp_nivel
+            # Configurações por par (pré-carregadas do config)
+            alavancagem, risco_percentual = self._par_risk.get(par, _RISCO_PADRAO)
             
-            rr_ratio = distancia_tp / distancia_sl if distancia_sl > 0 else 0
+            # LONG = +1, SHORT = -1 (mesmas fórmulas com o sinal invertido)
+            sinal = 1.0 if direcao == "LONG" else -1.0
+            tp_nivel, rr_ratio, distancia_sl, distancia_tp = _calc_risco_nb(
+                float(preco_entrada), float(sl_nivel), sinal, _RR_TARGET
+            )
 
             resultado = {
                 "sl": sl_nivel,
@@ -319,10 +582,14 @@ class GerenciadorBot(GerenciadorBase):
                 "distancia_tp": distancia_tp,
             }
 
-            if self.logger:
+            if self.logger is not None and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
-                    f"[{self.GERENCIADOR_NAME}] Risco calculado para {par}: "
-                    f"SL={sl_nivel:.2f}, TP={tp_nivel:.2f}, R:R={rr_ratio:.2f}"
+                    "[%s] Risco calculado para %s: SL=%.2f, TP=%.2f, R:R=%.2f",
+                    self.GERENCIADOR_NAME,
+                    par,
+                    sl_nivel,
+                    tp_nivel,
+                    rr_ratio,
                 )
 
             return resultado
@@ -334,6 +601,93 @@ class GerenciadorBot(GerenciadorBase):
                 )
             return {}
 
+    def calcular_risco_vec(
+        self,
+        pares: List[str],
+        precos: np.ndarray,
+        sls: np.ndarray,
+        sinais: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calcula parâmetros de risco para vários pares de uma vez.
+        
+        Versão vetorizada de calcular_risco para quando o ciclo avalia muitos
+        candidatos: as fórmulas são aplicadas sobre arrays NumPy em vez de
+        um laço Python por par.
+        
+        Args:
+            pares: Pares de trading, na mesma ordem dos arrays
+            precos: Preços de entrada
+            sls: Níveis de stop loss
+            sinais: Direção de cada par (+1 para LONG, -1 para SHORT)
+            
+        Returns:
+            dict: Arrays alinhados com `pares` ({"sl", "tp", "tamanho_posicao",
+            "alavancagem", "rr_ratio", "distancia_sl", "distancia_tp"}),
+            ou dict vazio em caso de erro (inclusive tamanhos divergentes)
+        """
+        try:
+            precos = np.asarray(precos, dtype=np.float64)
+            sls = np.asarray(sls, dtype=np.float64)
+            sinais = np.asarray(sinais, dtype=np.float64)
+
+            # Arrays desalinhados seriam propagados em silêncio pelo broadcasting
+            formato = (len(pares),)
+            if precos.shape != formato or sls.shape != formato or sinais.shape != formato:
+                if self.logger:
+                    self.logger.error(
+                        f"[{self.GERENCIADOR_NAME}] Tamanhos divergentes no risco em lote: "
+                        f"pares={len(pares)}, precos={precos.shape}, sls={sls.shape}, sinais={sinais.shape}"
+                    )
+                return {}
+
+            # Configurações por par (pré-carregadas do config)
+            risco_pares = [self._par_risk.get(par, _RISCO_PADRAO) for par in pares]
+            alavancagens = np.fromiter(
+                (alavancagem for alavancagem, _ in risco_pares),
+                dtype=np.int64,
+                count=len(pares),
+            )
+            riscos = np.fromiter(
+                (risco for _, risco in risco_pares),
+                dtype=np.float64,
+                count=len(pares),
+            )
+            
+            distancias_sl = np.abs(precos - sls)
+            tps = precos + sinais * distancias_sl * _RR_TARGET
+            distancias_tp = sinais * (tps - precos)
+            rr = np.divide(
+                distancias_tp,
+                distancias_sl,
+                out=np.zeros_like(distancias_sl),
+                where=distancias_sl > 0,
+            )
+            
+            if self.logger is not None and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "[%s] Risco calculado em lote para %d pares",
+                    self.GERENCIADOR_NAME,
+                    len(pares),
+                )
+            
+            return {
+                "sl": sls,
+                "tp": tps,
+                "tamanho_posicao": riscos,
+                "alavancagem": alavancagens,
+                "rr_ratio": rr,
+                "distancia_sl": distancias_sl,
+                "distancia_tp": distancias_tp,
+            }
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    f"[{self.GERENCIADOR_NAME}] Erro ao calcular risco em lote: {e}",
+                    exc_info=True,
+                )
+            return {}
+
     def executar(self, *args, **kwargs):
         """
         Executa lógica principal do bot.
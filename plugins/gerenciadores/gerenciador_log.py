@@ -17,20 +17,102 @@ Rotação: a cada 5MB ou diária (compactação após 30 dias, retenção de 7 d
 
 import logging
 import os
-import inspect
-from datetime import datetime
+import re
+import time
+import sys
+import json
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
-from logging.handlers import RotatingFileHandler
-import gzip
+from typing import Optional, Dict, Any, Tuple
+from logging.handlers import QueueHandler, QueueListener, MemoryHandler
+import atexit
+import copy
+import queue
+from collections import deque
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import shutil
-import pytz
+import zlib
+from zoneinfo import ZoneInfo
 
 # Importa funcionalidades avançadas de log (cores, TRACE)
-from utils.log_helper import SmartFormatter, TRACE_LEVEL
+from utils.log_helper import (
+    SmartFormatter, HorarioFuso, TRACE_LEVEL, anotar_categoria, categoria_sem_origem, formatar_com_rotulo
+)
 from enum import Enum
 
 
+# Timezone de São Paulo (instância única, reutilizada pelos formatters)
+_SP_TZ = ZoneInfo("America/Sao_Paulo")
+
+# Buffer dos arquivos de log (bytes)
+_BUFFER_ARQUIVO = 64 * 1024
+
+# A partir de quantas chaves os detalhes são serializados como JSON
+_LIMITE_DETALHES_JSON = 8
+
+# Data no nome dos arquivos de log (YYYY-MM-DD)
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+
+def _compactar_gzip(origem, destino, nivel: int = 1, bloco: int = 1 << 20):
+    """
+    Compacta `origem` em `destino` (formato gzip) em blocos de 1 MiB,
+    direto sobre os descritores, sem camadas de arquivo em Python.
+    
+    Args:
+        origem: Arquivo a compactar
+        destino: Arquivo .gz (ou temporário) a criar
+        nivel: Nível de compressão (1-9)
+        bloco: Tamanho de cada leitura em bytes
+    """
+    # wbits=31: stream deflate com cabeçalho/rodapé gzip
+    compressor = zlib.compressobj(nivel, zlib.DEFLATED, 31)
+    fd_origem = os.open(origem, os.O_RDONLY)
+    try:
+        fd_destino = os.open(destino, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while True:
+                dados = os.read(fd_origem, bloco)
+                if not dados:
+                    break
+                saida = compressor.compress(dados)
+                if saida:
+                    _escrever_tudo(fd_destino, saida)
+            _escrever_tudo(fd_destino, compressor.flush())
+        finally:
+            os.close(fd_destino)
+    finally:
+        os.close(fd_origem)
+
+
+def _sincronizar_diretorio(diretorio):
+    """
+    fsync do próprio diretório: persiste de uma vez as entradas removidas/renomeadas.
+    Sem efeito onde diretórios não podem ser abertos (ex: Windows).
+    
+    Args:
+        diretorio: Caminho do diretório
+    """
+    try:
+        fd = os.open(diretorio, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _escrever_tudo(fd: int, dados: bytes):
+    """os.write pode gravar parcialmente: repete até gravar todos os bytes."""
+    visao = memoryview(dados)
+    while visao:
+        visao = visao[os.write(fd, visao):]
+
+
 class CategoriaLog(Enum):
     """
     Categorias de log baseadas em responsabilidade funcional.
@@ -48,6 +130,402 @@ class CategoriaLog(Enum):
     UTIL = "UTIL"            # Utilitários e helpers (conversores, checagens)
 
 
+class SPFormatter(logging.Formatter):
+    """
+    Formatter dos arquivos de log: horário de São Paulo com milissegundos e
+    substituição de [LEVEL] pela categoria quando a mensagem começa com [CATEGORIA].
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._horario = HorarioFuso(_SP_TZ)
+
+    def formatTime(self, record, datefmt=None):
+        # Offset de São Paulo em cache (recalculado por hora) + uma chamada a time.strftime
+        return self._horario.formatar(record.created, datefmt or self.default_time_format)
+    
+    def format(self, record):
+        # A 1ª tag identifica a origem (redundante com o nome do logger) e é descartada;
+        # uma 2ª tag, se houver (ex: [ERRO_CRITICO]), é a categoria e ocupa o lugar do nível
+        categoria, mensagem = categoria_sem_origem(record)
+        return formatar_com_rotulo(self, record, categoria or record.levelname, mensagem)
+
+class FastRotatingFileHandler(logging.FileHandler):
+    """
+    FileHandler com rotação por tamanho verificada fora do emit.
+    
+    O RotatingFileHandler checa (e formata o record para medir) a cada emit;
+    aqui a escrita é um write simples e a rotação é feita por
+    verificar_rotacao(), chamado periodicamente pela thread de manutenção.
+    Backups seguem o mesmo esquema: arquivo.log.1 ... arquivo.log.N
+    """
+
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0, encoding=None, delay=False):
+        super().__init__(filename, mode="a", encoding=encoding, delay=delay)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+
+    def _open(self):
+        # Buffer de 64KB: vários records viram um único write() no disco
+        return open(
+            self.baseFilename, self.mode, buffering=_BUFFER_ARQUIVO,
+            encoding=self.encoding, errors=self.errors,
+        )
+
+    def emit(self, record):
+        """Escreve no buffer; só força o flush para ERROR e acima."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def emitir_lote(self, records):
+        """
+        Formata vários records e grava todos com um único write (equivalente
+        ao writev: N linhas, uma chamada). Flush imediato se houver ERROR+.
+        """
+        linhas = []
+        urgente = False
+        for record in records:
+            if not self.filter(record):
+                continue
+            try:
+                linhas.append(self.format(record))
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+                continue
+            if record.levelno >= logging.ERROR:
+                urgente = True
+        if not linhas:
+            return
+        with self.lock:
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(self.terminator.join(linhas) + self.terminator)
+                if urgente:
+                    self.stream.flush()
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(records[-1])
+
+    def verificar_rotacao(self):
+        """Rotaciona o arquivo se atingiu maxBytes (thread-safe com os writes)."""
+        if self.maxBytes <= 0:
+            return
+        try:
+            tamanho = os.stat(self.baseFilename).st_size
+        except OSError:
+            return
+        if tamanho >= self.maxBytes:
+            with self.lock:
+                self.doRollover()
+
+    def doRollover(self):
+        """
+        Rotação por cópia + truncate: o arquivo ativo nunca é fechado nem
+        renomeado, então não há janela em que os writes ficam sem stream.
+        """
+        if self.stream:
+            self.stream.flush()
+        if self.backupCount > 0:
+            for i in range(self.backupCount - 1, 0, -1):
+                origem = f"{self.baseFilename}.{i}"
+                if os.path.exists(origem):
+                    os.replace(origem, f"{self.baseFilename}.{i + 1}")
+            shutil.copyfile(self.baseFilename, f"{self.baseFilename}.1")
+        if self.stream:
+            self.stream.seek(0)
+            self.stream.truncate()
+        else:
+            os.truncate(self.baseFilename, 0)
+
+
+class _MemoryHandlerLote(MemoryHandler):
+    """MemoryHandler que entrega o buffer inteiro ao target em um único lote."""
+
+    def flush(self):
+        with self.lock:
+            if self.target and self.buffer:
+                self.target.emitir_lote(self.buffer)
+                self.buffer.clear()
+
+
+class _LazyDetails:
+    """
+    Adia a montagem do texto de detalhes até o record ser formatado
+    (usado como argumento %s nas mensagens de log).
+    
+    Dicionários pequenos saem como "k: v, k: v"; a partir de
+    _LIMITE_DETALHES_JSON chaves saem como JSON compacto (serializado em C).
+    
+    O texto é montado na thread do listener, então guarda uma cópia rasa do
+    dict: o chamador pode alterar ou reaproveitar o seu depois de logar.
+    """
+
+    __slots__ = ("d", "sep")
+
+    def __init__(self, d: Dict[str, Any], sep: str = ": "):
+        self.d = dict(d)
+        self.sep = sep
+
+    def __str__(self):
+        d = self.d
+        if len(d) >= _LIMITE_DETALHES_JSON:
+            try:
+                return json.dumps(d, default=str, ensure_ascii=False, separators=(",", ":"))
+            except (TypeError, ValueError):
+                pass  # Chaves não serializáveis / referência circular: usa o formato texto
+        sep = self.sep
+        # Lista, não genexpr: join materializa a sequência de qualquer forma
+        return ", ".join([f"{k}{sep}{v}" for k, v in d.items()])
+
+
+class _QueueHandlerTipo(QueueHandler):
+    """
+    QueueHandler que marca cada record com o tipo_log do logger de origem,
+    permitindo que o listener encaminhe para o arquivo correto.
+    
+    A fila é local ao processo, então o record não precisa ser serializável:
+    msg e args seguem crus e o texto só é montado na thread do listener.
+    """
+
+    def __init__(self, fila, tipo_log: str):
+        super().__init__(fila)
+        self.tipo_log = tipo_log
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        # exc_info segue intacto: o traceback é formatado na thread do listener,
+        # uma única vez (exc_text fica em cache no record para arquivo e console).
+        # Custo: os frames do traceback ficam vivos até o listener drenar o record
+        record.tipo_log = self.tipo_log
+        return record
+
+    def handle(self, record):
+        # A fila já é thread-safe: dispensa o lock do handler (compartilhado por todos
+        # os loggers do tipo), deixando no thread chamador apenas prepare + put
+        rv = self.filter(record)
+        if rv:
+            if isinstance(rv, logging.LogRecord):
+                record = rv
+            self.emit(record)
+        return rv
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.queue.registrar_descarte()
+
+
+class _LimiteTraceback(logging.Filter):
+    """
+    Limita quantos records com traceback passam por janela de tempo.
+    
+    Acima do limite (ex: cascata de erros críticos), o traceback não é
+    formatado: o record segue com uma nota no lugar do stack trace.
+    """
+
+    def __init__(self, maximo: int = 10, janela: float = 60.0):
+        super().__init__()
+        self.janela = janela
+        self._tempos = deque(maxlen=maximo)
+        self._suprimidos = 0
+        # O filtro roda na thread de quem loga: verificação e registro precisam
+        # ser atômicos justamente nas rajadas de erros concorrentes
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if not record.exc_info:
+            return True
+        tempos = self._tempos
+        with self._lock:
+            if len(tempos) == tempos.maxlen and record.created - tempos[0] < self.janela:
+                self._suprimidos += 1
+                suprimidos = self._suprimidos
+            else:
+                tempos.append(record.created)
+                self._suprimidos = 0
+                return True
+        # Altera o próprio record (o logger só tem este handler); roda antes do prepare
+        record.exc_info = None
+        record.exc_text = (
+            f"(traceback omitido: {suprimidos} suprimido(s), "
+            f"limite de {tempos.maxlen} a cada {self.janela:.0f}s)"
+        )
+        return True
+
+
+class _FilaLog(queue.Queue):
+    """
+    Fila limitada entre os loggers e o listener.
+    
+    Se o disco travar, a fila não cresce sem limite: registros excedentes
+    são descartados e contados em `descartados` (o listener reporta depois).
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        super().__init__(maxsize)
+        self.descartados = 0
+        # Produtores incrementam e o listener zera: += não é atômico entre threads
+        self._lock_descartes = threading.Lock()
+
+    def registrar_descarte(self):
+        """Conta um registro descartado por fila cheia."""
+        with self._lock_descartes:
+            self.descartados += 1
+
+    def coletar_descartados(self) -> int:
+        """
+        Lê e zera o contador de descartes de forma atômica.
+        
+        Returns:
+            int: Registros descartados desde a última coleta
+        """
+        with self._lock_descartes:
+            descartados, self.descartados = self.descartados, 0
+        return descartados
+
+
+class _QueueListenerDedup(QueueListener):
+    """
+    QueueListener que suprime linhas idênticas repetidas (estilo syslog).
+    
+    Por logger, guarda a última mensagem emitida (com o nível). Repetições
+    do mesmo nível dentro de `janela` segundos (até `max_repeticoes`) são
+    descartadas; a linha "Última mensagem repetida N vezes" é emitida quando
+    chega uma mensagem diferente, quando a janela expira (via
+    emitir_resumos_expirados, chamado pelo flush periódico) ou no stop.
+    Records de ERROR e acima nunca são suprimidos.
+    """
+
+    def __init__(self, fila, *handlers, respect_handler_level=False, janela: float = 60.0,
+                 max_repeticoes: int = 1000):
+        super().__init__(fila, *handlers, respect_handler_level=respect_handler_level)
+        self.janela = janela
+        self.max_repeticoes = max_repeticoes
+        # {nome_logger: [(levelno, mensagem), repeticoes, ts_ultima_emissao, ultimo_record_suprimido]}
+        self._ultimas: Dict[str, list] = {}
+        # Protege _ultimas: usado pela thread do listener e pelo flush periódico
+        self._lock_ultimas = threading.Lock()
+
+    def handle(self, record):
+        fila = self.queue
+        # Leitura sem lock só como atalho; a coleta é atômica
+        if fila.descartados and fila.qsize() < fila.maxsize // 2:
+            # Fila voltou a ter folga: registra quantas linhas foram perdidas
+            descartados = fila.coletar_descartados()
+            aviso = logging.makeLogRecord({
+                "name": "GerenciadorLog_system",
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": "%d registros de log descartados (fila cheia)",
+                "args": (descartados,),
+                "tipo_log": "system",
+            })
+            super().handle(aviso)
+        
+        mensagem = record.getMessage()
+        with self._lock_ultimas:
+            estado = self._ultimas.get(record.name)
+            if record.levelno >= logging.ERROR:
+                # Erros (e seus tracebacks) nunca são suprimidos
+                if estado is not None:
+                    self._emitir_resumo(estado)
+                    del self._ultimas[record.name]
+            else:
+                chave = (record.levelno, mensagem)
+                if estado is not None:
+                    if (
+                        estado[0] == chave
+                        and estado[1] < self.max_repeticoes
+                        and record.created < estado[2] + self.janela
+                    ):
+                        estado[1] += 1
+                        estado[3] = record
+                        return
+                    self._emitir_resumo(estado)
+                self._ultimas[record.name] = [chave, 0, record.created, None]
+            # Categoria extraída uma única vez, reaproveitada pelos formatters de arquivo e console
+            anotar_categoria(record, mensagem)
+            super().handle(record)
+
+    def emitir_resumos_expirados(self, agora: float):
+        """
+        Emite o resumo das repetições cuja janela já expirou, para que uma
+        rajada não fique invisível enquanto o logger estiver em silêncio.
+        
+        Args:
+            agora: Timestamp atual (epoch)
+        """
+        with self._lock_ultimas:
+            for estado in self._ultimas.values():
+                if estado[1] and agora >= estado[2] + self.janela:
+                    self._emitir_resumo(estado)
+
+    def _emitir_resumo(self, estado: list):
+        """Emite a linha de resumo das repetições suprimidas (se houver)."""
+        if estado[1]:
+            resumo = copy.copy(estado[3])
+            resumo.msg = "Última mensagem repetida %d vezes"
+            resumo.args = (estado[1],)
+            resumo.exc_info = None
+            resumo.exc_text = None
+            resumo.stack_info = None
+            anotar_categoria(resumo)
+            super().handle(resumo)
+            estado[1] = 0
+
+    def enqueue_sentinel(self):
+        # Bloqueante: com a fila cheia o sentinel precisa esperar espaço
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        super().stop()
+        # Fila drenada: registra repetições ainda pendentes
+        with self._lock_ultimas:
+            for estado in self._ultimas.values():
+                self._emitir_resumo(estado)
+
+
+class _DespachanteTipo(logging.Handler):
+    """
+    Handler usado pelo QueueListener: encaminha o record para o handler
+    de arquivo do seu tipo_log (executa na thread do listener).
+    
+    Records de nível WARNING de qualquer tipo também vão para o arquivo de
+    "warnings": o mesmo record é gravado nos dois arquivos, sem log duplicado.
+    """
+
+    def __init__(self, handlers_tipo: Dict[str, logging.Handler]):
+        super().__init__()
+        self.handlers_tipo = handlers_tipo
+
+    def emit(self, record):
+        tipo_log = getattr(record, "tipo_log", None)
+        handler = self.handlers_tipo.get(tipo_log)
+        if handler is not None and record.levelno >= handler.level:
+            handler.handle(record)
+        if record.levelno == logging.WARNING and tipo_log != "warnings":
+            handler_warnings = self.handlers_tipo.get("warnings")
+            if handler_warnings is not None:
+                handler_warnings.handle(record)
+
+    def flush(self):
+        for handler in list(self.handlers_tipo.values()):
+            handler.flush()
+
+
 class GerenciadorLog:
     """
     Gerenciador centralizado de logs do sistema Smart Trader.
@@ -62,17 +540,26 @@ class GerenciadorLog:
     
     Atributos:
         base_path (Path): Caminho base do diretório de logs
-        loggers (dict): Cache de loggers criados
+        loggers (dict): Cache de loggers criados, chave (nome, tipo_log);
+            handlers são compartilhados por tipo_log
         formato_padrao (str): Formato padrão dos logs (UTC com milissegundos)
         retencao_dias (int): Dias de retenção de logs ativos (padrão: 7)
         retencao_arquivo_dias (int): Dias completos antes de compactar (padrão: 30)
+        nivel_compactacao (int): Nível gzip dos logs compactados (padrão: 1)
     """
 
+    # Tipos de log suportados (um diretório e um arquivo por tipo)
+    _TIPOS_VALIDOS = frozenset({
+        "spot", "futures", "ia", "system", "banco",
+        "sinais", "erros", "warnings", "critical", "padroes",
+    })
+
     def __init__(
         self, 
         base_path: str = "logs",
         retencao_dias: int = 7,
-        retencao_arquivo_dias: int = 30
+        retencao_arquivo_dias: int = 30,
+        nivel_compactacao: int = 1,
     ):
         """
         Inicializa o GerenciadorLog.
@@ -81,12 +568,41 @@ class GerenciadorLog:
             base_path: Caminho base do diretório de logs
             retencao_dias: Dias de retenção de logs ativos (padrão: 7)
             retencao_arquivo_dias: Dias completos antes de compactar (padrão: 30)
+            nivel_compactacao: Nível gzip (1-9) dos logs compactados (padrão: 1)
         """
         self.base_path = Path(base_path)
-        self.loggers: Dict[str, logging.Logger] = {}
+        # Diretório de cada tipo_log, resolvido uma vez
+        self._dirs: Dict[str, Path] = {tipo: self.base_path / tipo for tipo in self._TIPOS_VALIDOS}
+        self.loggers: Dict[Tuple[str, str], logging.Logger] = {}
+        self._ultimo_logger: Tuple[Optional[str], Optional[str], Optional[logging.Logger]] = (None, None, None)
         
         # Timezone de São Paulo
-        self.timezone_sp = pytz.timezone('America/Sao_Paulo')
+        self.timezone_sp = _SP_TZ
+        # Offset em cache (revisto a cada hora): acompanha mudanças de horário de verão
+        self._horario_sp = HorarioFuso(_SP_TZ)
+        
+        # Cache de caminhos por tipo_log: {tipo_log: (indice_do_dia, Path)}
+        self._path_cache: Dict[str, Tuple[int, Path]] = {}
+        # Data do dia (horário de São Paulo) como texto, compartilhada por todos os tipos
+        self._data_cache: Tuple[int, str] = (-1, "")
+        
+        # Escrita assíncrona: loggers só enfileiram; formatação e I/O rodam na thread do listener
+        self._log_queue = _FilaLog(maxsize=100_000)
+        self._handlers_tipo: Dict[str, logging.Handler] = {}
+        # Um único QueueHandler por tipo_log, compartilhado por todos os loggers do tipo
+        self._queue_handlers: Dict[str, QueueHandler] = {}
+        self._console_handler = self._criar_console_handler()
+        self._listener = _QueueListenerDedup(
+            self._log_queue,
+            _DespachanteTipo(self._handlers_tipo),
+            self._console_handler,
+            respect_handler_level=True,
+        )
+        
+        # Flush periódico dos buffers de arquivo (política "buffer cheio ou 1s");
+        # threads só são iniciadas em iniciar()
+        self._parar_flush = threading.Event()
+        self._thread_flush: Optional[threading.Thread] = None
         
         # Formato com timezone de São Paulo, milissegundos e informações de rastreamento
         # Suporta categoria opcional: [CATEGORIA] será adicionado quando especificado
@@ -97,56 +613,61 @@ class GerenciadorLog:
             "[%(asctime)s.%(msecs)03d BRT] [%(name)s] [%(levelname)s] [%(filename)s:%(lineno)d] [%(categoria)s] %(message)s"
         )
         self.data_format = "%Y-%m-%d %H:%M:%S"
+        # Formatter único compartilhado pelos handlers de arquivo de todos os tipos
+        self._file_formatter = SPFormatter(self.formato_padrao, datefmt=self.data_format)
         
         # Retenção
         self.retencao_dias = retencao_dias
         self.retencao_arquivo_dias = retencao_arquivo_dias
+        self.nivel_compactacao = nivel_compactacao
         
         # Cria estrutura de diretórios
         self._criar_estrutura_diretorios()
         
-        # Garante que todos os arquivos de log sejam criados na inicialização
-        self._criar_arquivos_log_iniciais()
+        # Limpeza/compactação de logs antigos fora da thread principal (ao iniciar e a cada hora)
+        # Arquivos em compactação no momento (guardado por _lock_compactacao): evita
+        # que duas varreduras compactem o mesmo arquivo, sem serializar arquivos diferentes
+        self._lock_compactacao = threading.Lock()
+        self._compactando: set = set()
+        self._thread_limpeza: Optional[threading.Thread] = None
+        
+        # Handlers de "system" (avisos internos do listener) e "warnings"
+        # (cópia dos WARNING de todos os tipos) sempre existem
+        self._obter_handler_arquivo("system")
+        self._obter_handler_arquivo("warnings")
+
+    def iniciar(self) -> bool:
+        """
+        Inicia as threads do GerenciadorLog: listener da fila (arquivo e
+        console), flush periódico dos buffers e limpeza/compactação de logs
+        antigos. Até aqui os loggers apenas enfileiram. Contraparte: finalizar().
         
-        # Limpa logs antigos na inicialização
-        self._limpar_logs_antigos()
+        Returns:
+            bool: True se iniciado com sucesso (ou já iniciado), False caso contrário.
+        """
+        if self._thread_flush is not None:
+            return True
+        try:
+            self._listener.start()
+            self._thread_flush = threading.Thread(
+                target=self._flush_periodico, name="GerenciadorLogFlush", daemon=True
+            )
+            self._thread_flush.start()
+            self._thread_limpeza = threading.Thread(
+                target=self._limpeza_periodica, name="GerenciadorLogLimpeza", daemon=True
+            )
+            self._thread_limpeza.start()
+            atexit.register(self._parar_listener)
+            return True
+        except Exception as e:
+            print(f"[GerenciadorLog] ERRO ao iniciar: {e}")
+            return False
 
     def _criar_estrutura_diretorios(self):
         """Cria a estrutura de diretórios de log conforme padrão."""
-        diretorios = [
-            "spot",
-            "futures", 
-            "ia",
-            "system",
-            "banco",
-            "sinais",
-            "erros",
-            "warnings",
-            "critical",
-            "padroes",
-        ]
-        
-        for diretorio in diretorios:
-            caminho = self.base_path / diretorio
+        for caminho in self._dirs.values():
             caminho.mkdir(parents=True, exist_ok=True)
     
-    def _criar_arquivos_log_iniciais(self):
-        """
-        Cria todos os arquivos de log na inicialização para garantir que existam.
-        """
-        tipos_log = ["spot", "futures", "ia", "system", "banco", "sinais", "erros", "warnings", "critical", "padroes"]
-        for tipo_log in tipos_log:
-            try:
-                arquivo_log = self._obter_caminho_arquivo(tipo_log)
-                # Garante que o arquivo existe e tem pelo menos uma linha
-                if arquivo_log.exists() and arquivo_log.stat().st_size == 0:
-                    with open(arquivo_log, 'a', encoding='utf-8') as f:
-                        data_hora = datetime.now(self.timezone_sp).strftime("%Y-%m-%d %H:%M:%S")
-                        f.write(f"[{data_hora} BRT] [GerenciadorLog] [INFO] [gerenciador_log.py:108] Arquivo de log '{tipo_log}' inicializado\n")
-                        f.flush()
-            except Exception:
-                pass  # Ignora erros na criação inicial
-
     def get_logger(
         self,
         nome: str,
@@ -156,6 +677,10 @@ class GerenciadorLog:
         """
         Obtém ou cria um logger para o nome especificado.
         
+        Cada (nome, tipo_log) tem seu próprio Logger (nível e %(name)s por
+        componente), mas todos os loggers de um tipo_log compartilham o mesmo
+        QueueHandler e o mesmo handler de arquivo: um arquivo aberto por tipo.
+        
         Tipos de log suportados:
         - spot: Mercado à vista
         - futures: Contratos perpétuos/alavancados
@@ -170,23 +695,76 @@ class GerenciadorLog:
         Returns:
             logging.Logger: Logger configurado
         """
+        # Chamadas consecutivas quase sempre repetem (nome, tipo_log): cache de uma posição
+        ultimo = self._ultimo_logger
+        if ultimo[0] == nome and ultimo[1] == tipo_log:
+            return ultimo[2]
+        
+        # Caminho comum: logger já criado - uma única consulta ao cache (chave em tupla)
+        cache_key = (nome, tipo_log)
+        logger = self.loggers.get(cache_key)
+        if logger is not None:
+            self._ultimo_logger = (nome, tipo_log, logger)
+            return logger
+        
         # Valida tipo_log
-        tipos_validos = ["spot", "futures", "ia", "system", "banco", "sinais", "erros", "warnings", "critical", "padroes"]
-        if tipo_log not in tipos_validos:
+        if tipo_log not in self._TIPOS_VALIDOS:
             tipo_log = "system"
-        
-        # Cache key único por nome e tipo
-        cache_key = f"{nome}_{tipo_log}"
-        
-        if cache_key in self.loggers:
-            return self.loggers[cache_key]
+            logger = self.loggers.get((nome, tipo_log))
+            if logger is not None:
+                # Tipo inválido passa a apontar direto para o logger de "system"
+                self.loggers[cache_key] = logger
+                return logger
         
         # Cria novo logger
-        logger = logging.getLogger(cache_key)
+        logger = logging.getLogger(f"{nome}_{tipo_log}")
         logger.setLevel(nivel)
         
         # Remove handlers existentes (evita duplicação)
-        logger.handlers.clear()
+        if logger.handlers:
+            logger.handlers.clear()
+        
+        # Handler de arquivo é criado uma vez por tipo_log e usado pelo listener
+        arquivo_log = self._obter_handler_arquivo(tipo_log)
+        
+        # Logger apenas enfileira; o listener grava arquivo e console
+        queue_handler = self._queue_handlers.get(tipo_log)
+        if queue_handler is None:
+            queue_handler = self._queue_handlers[tipo_log] = _QueueHandlerTipo(self._log_queue, tipo_log)
+            if tipo_log == "critical":
+                # Em cascata de erros críticos, não formata um traceback por record
+                queue_handler.addFilter(_LimiteTraceback())
+        logger.addHandler(queue_handler)
+        
+        # Evita propagação para logger raiz
+        logger.propagate = False
+        
+        # Adiciona ao cache (também sob a chave pedida, se o tipo_log foi corrigido)
+        self.loggers[cache_key] = logger
+        self.loggers[(nome, tipo_log)] = logger
+        
+        # Testa escrita no arquivo para garantir que funciona (DEBUG para não poluir inicialização)
+        try:
+            logger.debug("[%s] Logger inicializado para tipo '%s' -> %s", nome, tipo_log, arquivo_log.name)
+        except Exception as e:
+            # Se houver erro, loga no console
+            print(f"[GerenciadorLog] AVISO: Erro ao criar arquivo de log {arquivo_log}: {e}")
+        
+        return logger
+
+    def _obter_handler_arquivo(self, tipo_log: str) -> Path:
+        """
+        Garante que existe o handler de arquivo do tipo_log no listener.
+        
+        Args:
+            tipo_log: Tipo de log
+            
+        Returns:
+            Path: Caminho do arquivo de log do tipo
+        """
+        handler = self._handlers_tipo.get(tipo_log)
+        if handler is not None:
+            return Path(handler.target.baseFilename)
         
         # Handler para arquivo específico por tipo (formato: {tipo_log}_2025-11-02.log)
         arquivo_log = self._obter_caminho_arquivo(tipo_log)
@@ -194,96 +772,76 @@ class GerenciadorLog:
         # Garante que o diretório existe
         arquivo_log.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             str(arquivo_log),  # Converte Path para string
             maxBytes=5 * 1024 * 1024,  # 5MB (conforme especificação)
             backupCount=10,  # Mantém últimos 10 arquivos rotacionados
             encoding="utf-8",
             delay=False,  # Cria arquivo imediatamente
         )
-        file_handler.setLevel(nivel)
-        
-        # Formatter customizado com timezone de São Paulo e milissegundos
-        class SPFormatter(logging.Formatter):
-            def __init__(self, fmt=None, datefmt=None, timezone_sp=None, suporta_categoria=False):
-                super().__init__(fmt, datefmt)
-                self.timezone_sp = timezone_sp
-                self.suporta_categoria = suporta_categoria
-            
-            def formatTime(self, record, datefmt=None):
-                # Converte para timezone de São Paulo
-                dt_utc = datetime.fromtimestamp(record.created, tz=pytz.UTC)
-                dt_sp = dt_utc.astimezone(self.timezone_sp)
-                if datefmt:
-                    s = dt_sp.strftime(datefmt)
-                else:
-                    s = dt_sp.strftime(self.default_time_format)
-                return s
-            
-            def format(self, record):
-                # Verifica se a mensagem começa com [CATEGORIA] (ex: [CORE], [FILTRO])
-                # Se sim, substitui o nível de log pela categoria
-                # Estratégia: lê mensagem original ANTES de formatar
-                mensagem_original = None
+        file_handler.setFormatter(self._file_formatter)
+        
+        # Agrupa gravações: descarrega com buffer cheio, em ERROR+ ou pelo flush periódico
+        self._handlers_tipo[tipo_log] = _MemoryHandlerLote(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        return arquivo_log
+
+    def _flush_periodico(self, intervalo: float = 1.0, ciclos_rotacao: int = 30):
+        """
+        Descarrega os buffers de arquivo a cada `intervalo` segundos (antes,
+        emite os resumos de repetição com janela vencida) e, a cada
+        `ciclos_rotacao` ciclos (~30s), verifica a rotação por tamanho.
+        """
+        ciclo = 0
+        while not self._parar_flush.wait(intervalo):
+            ciclo += 1
+            verificar = ciclo % ciclos_rotacao == 0
+            try:
+                # Repetições suprimidas com a janela vencida entram neste flush
+                self._listener.emitir_resumos_expirados(time.time())
+            except Exception:
+                pass
+            for handler in list(self._handlers_tipo.values()):
                 try:
-                    # Obtém mensagem original do record ANTES de formatar
-                    if hasattr(record, 'msg'):
-                        if isinstance(record.msg, str):
-                            mensagem_original = record.msg
-                        elif record.args:
-                            # Se há args, a mensagem será formatada - precisamos processar depois
-                            mensagem_original = None
-                        else:
-                            mensagem_original = str(record.msg)
-                except:
+                    handler.flush()
+                    handler.target.flush()
+                    if verificar:
+                        handler.target.verificar_rotacao()
+                except Exception:
                     pass
-                
-                # Se não conseguiu, tenta getMessage() mas isso pode já ter processado
-                if not mensagem_original:
-                    try:
-                        mensagem_original = record.getMessage()
-                    except:
-                        mensagem_original = None
-                
-                categoria_extraida = None
-                
-                # Primeiro, verifica se a categoria foi armazenada diretamente no record
-                if hasattr(record, '_categoria_log') and record._categoria_log:
-                    categoria_extraida = record._categoria_log
-                    # Remove categoria da mensagem se estiver presente
-                    if mensagem_original and isinstance(mensagem_original, str) and mensagem_original.startswith(f"[{categoria_extraida}]"):
-                        mensagem_sem_categoria = mensagem_original[len(f"[{categoria_extraida}]"):].strip()
-                        record.msg = mensagem_sem_categoria
-                        record.args = ()
-                # Se não encontrou, tenta extrair da mensagem
-                elif mensagem_original and isinstance(mensagem_original, str) and mensagem_original.startswith("[") and "]" in mensagem_original:
-                    fim_categoria = mensagem_original.find("]")
-                    if fim_categoria > 0:
-                        categoria_extraida = mensagem_original[1:fim_categoria]
-                        # Remove categoria da mensagem para não aparecer duplicada
-                        mensagem_sem_categoria = mensagem_original[fim_categoria + 1:].strip()
-                        record.msg = mensagem_sem_categoria
-                        record.args = ()
-                
-                # Formata normalmente
-                msg_formatada = super().format(record)
-                
-                # Se encontrou categoria, substitui [LEVEL] por [CATEGORIA] na mensagem formatada
-                if categoria_extraida:
-                    level = record.levelname
-                    # Substitui [LEVEL] por [CATEGORIA] no formato (apenas primeira ocorrência)
-                    if f"[{level}]" in msg_formatada:
-                        msg_formatada = msg_formatada.replace(f"[{level}]", f"[{categoria_extraida}]", 1)
-                
-                return msg_formatada
-        
-        file_formatter = SPFormatter(
-            self.formato_padrao, datefmt=self.data_format, timezone_sp=self.timezone_sp, suporta_categoria=True
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+    def _parar_listener(self):
+        """Para o listener (drena a fila pendente); seguro para chamadas repetidas."""
+        if self._parar_flush.is_set():
+            return
+        self._parar_flush.set()
+        if self._listener._thread is not None:
+            self._listener.stop()
+        for handler in list(self._handlers_tipo.values()):
+            handler.flush()
+            handler.target.flush()
+
+    def finalizar(self) -> bool:
+        """
+        Finaliza o GerenciadorLog (contraparte de iniciar()): grava tudo o que
+        ainda está na fila e nos buffers e para as threads.
         
-        # Handler para console (INFO e acima, formato simplificado com cores)
+        Returns:
+            bool: True se finalizado com sucesso, False caso contrário.
+        """
+        try:
+            self._parar_listener()
+            return True
+        except Exception as e:
+            print(f"[GerenciadorLog] ERRO ao finalizar: {e}")
+            return False
+
+    def _criar_console_handler(self) -> logging.Handler:
+        """Cria o handler de console (INFO e acima, formato simplificado com cores)."""
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         # Usa SmartFormatter com cores para console
@@ -291,29 +849,11 @@ class GerenciadorLog:
             "[%(asctime)s BRT] [%(name)s] [%(levelname)s] [%(filename)s:%(lineno)d] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
             timezone_sp=self.timezone_sp,
-            use_colors=True  # Habilita cores no console
+            use_colors=True,  # Habilita cores no console
+            descartar_origem=True,  # Mesmo rótulo dos arquivos de log
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
-        
-        # Evita propagação para logger raiz
-        logger.propagate = False
-        
-        # Adiciona ao cache
-        self.loggers[cache_key] = logger
-        
-        # Testa escrita no arquivo para garantir que funciona (DEBUG para não poluir inicialização)
-        try:
-            logger.debug(f"[{nome}] Logger inicializado para tipo '{tipo_log}' -> {arquivo_log.name}")
-            # Força flush imediato
-            for handler in logger.handlers:
-                if hasattr(handler, 'flush'):
-                    handler.flush()
-        except Exception as e:
-            # Se houver erro, loga no console
-            print(f"[GerenciadorLog] AVISO: Erro ao criar arquivo de log {arquivo_log}: {e}")
-        
-        return logger
+        return console_handler
 
     def _obter_caminho_arquivo(self, tipo_log: str) -> Path:
         """
@@ -327,27 +867,27 @@ class GerenciadorLog:
         Returns:
             Path: Caminho completo do arquivo de log
         """
-        data_atual = datetime.now(self.timezone_sp).strftime("%Y-%m-%d")
+        # Reaproveita o caminho enquanto o dia (horário de São Paulo) não muda
+        agora = time.time()
+        dia_atual = (int(agora) + self._horario_sp.offset(agora)) // 86400
+        em_cache = self._path_cache.get(tipo_log)
+        if em_cache is not None and em_cache[0] == dia_atual:
+            return em_cache[1]
+        
+        dia_data, data_atual = self._data_cache
+        if dia_data != dia_atual:
+            data_atual = self._horario_sp.formatar(agora, "%Y-%m-%d")
+            self._data_cache = (dia_atual, data_atual)
         nome_arquivo = f"{tipo_log}_{data_atual}.log"
-        diretorio = self.base_path / tipo_log
+        diretorio = self._dirs[tipo_log]
         
         # Garante que o diretório existe
         diretorio.mkdir(parents=True, exist_ok=True)
         
+        # O arquivo em si é criado pelo handler (delay=False) ao abrir o stream
         arquivo_log = diretorio / nome_arquivo
         
-        # Garante que o arquivo existe (cria se não existir) e escreve uma linha inicial
-        if not arquivo_log.exists():
-            arquivo_log.touch()
-            # Escreve linha inicial para garantir que o arquivo seja criado
-            try:
-                with open(arquivo_log, 'a', encoding='utf-8') as f:
-                    data_hora = datetime.now(self.timezone_sp).strftime("%Y-%m-%d %H:%M:%S")
-                    f.write(f"[{data_hora} BRT] [GerenciadorLog] [INFO] [gerenciador_log.py:237] Arquivo de log '{tipo_log}' criado\n")
-                    f.flush()
-            except Exception:
-                pass  # Ignora erro na criação inicial
-        
+        self._path_cache[tipo_log] = (dia_atual, arquivo_log)
         return arquivo_log
 
     def log_evento(
@@ -376,38 +916,36 @@ class GerenciadorLog:
         """
         logger = self.get_logger(nome_origem, tipo_log, nivel)
         
-        # Monta mensagem estruturada
-        partes = [mensagem]
+        # Fast path: nível desabilitado não monta nada
+        if not logger.isEnabledFor(nivel):
+            return
         
+        # Monta mensagem estruturada (%-style: texto final só é montado ao formatar)
+        # Um template fixo para cada combinação de par/detalhes
         if par:
-            partes.append(f"Par: {par}")
-        
-        if detalhes:
-            detalhes_str = ", ".join([f"{k}: {v}" for k, v in detalhes.items()])
-            partes.append(f"Detalhes: {detalhes_str}")
-        
-        mensagem_completa = " | ".join(partes)
+            if detalhes:
+                formato = "[%s] %s | Par: %s | Detalhes: %s"
+                args = (tipo_evento, mensagem, par, _LazyDetails(detalhes))
+            else:
+                formato = "[%s] %s | Par: %s"
+                args = (tipo_evento, mensagem, par)
+        elif detalhes:
+            formato = "[%s] %s | Detalhes: %s"
+            args = (tipo_evento, mensagem, _LazyDetails(detalhes))
+        else:
+            formato = "[%s] %s"
+            args = (tipo_evento, mensagem)
         
         # Log conforme nível (garante que seja salvo no arquivo)
         if nivel == logging.ERROR:
-            logger.error(f"[{tipo_evento}] {mensagem_completa}")
+            logger.error(formato, *args)
         elif nivel == logging.WARNING:
-            # Warnings também vão para log de warnings
-            logger_warning = self.get_logger(nome_origem, "warnings", nivel=logging.WARNING)
-            logger_warning.warning(f"[{tipo_evento}] {mensagem_completa}")
-            for handler in logger_warning.handlers:
-                if hasattr(handler, 'flush'):
-                    handler.flush()
-            logger.warning(f"[{tipo_evento}] {mensagem_completa}")
+            # O listener também grava este record no log de warnings
+            logger.warning(formato, *args)
         elif nivel == logging.CRITICAL:
-            logger.critical(f"[{tipo_evento}] {mensagem_completa}")
+            logger.critical(formato, *args)
         else:
-            logger.info(f"[{tipo_evento}] {mensagem_completa}")
-        
-        # Força flush para garantir que o log seja escrito imediatamente
-        for handler in logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
+            logger.info(formato, *args)
     
     def log_categoria(
         self,
@@ -435,30 +973,32 @@ class GerenciadorLog:
             plugin_nome: Nome do plugin (para categoria PLUGIN, ex: "PluginSupertrend")
         """
         logger = self.get_logger(nome_origem, tipo_log, nivel)
+        if not logger.isEnabledFor(nivel):
+            return
         
         # Monta mensagem com categoria
         categoria_str = categoria.value
         if categoria == CategoriaLog.PLUGIN and plugin_nome:
             categoria_str = f"PLUGIN:{plugin_nome}"
         
-        mensagem_com_categoria = f"[{categoria_str}] {mensagem}"
-        
-        # Adiciona detalhes se fornecidos
+        # Detalhes só viram texto quando o record for formatado
         if detalhes:
-            detalhes_str = ", ".join([f"{k}: {v}" for k, v in detalhes.items()])
-            mensagem_com_categoria += f" | Detalhes: {detalhes_str}"
+            formato = "[%s] %s | Detalhes: %s"
+            args = (categoria_str, mensagem, _LazyDetails(detalhes))
+        else:
+            formato = "[%s] %s"
+            args = (categoria_str, mensagem)
         
         # Cria um LogRecord customizado com a categoria armazenada
         # Isso garante que o formatter possa detectar a categoria
-        import logging
-        frame = inspect.currentframe().f_back
+        frame = sys._getframe(1)
         record = logging.LogRecord(
             name=logger.name,
             level=nivel,
             pathname=frame.f_code.co_filename if frame else "",
             lineno=frame.f_lineno if frame else 0,
-            msg=mensagem_com_categoria,
-            args=(),
+            msg=formato,
+            args=args,
             exc_info=None
         )
         # Armazena categoria no record para o formatter detectar
@@ -466,11 +1006,6 @@ class GerenciadorLog:
         
         # Log conforme nível usando handle() para garantir que o formatter seja chamado
         logger.handle(record)
-        
-        # Força flush para garantir que o log seja escrito imediatamente
-        for handler in logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
 
     def log_erro_bot(
         self,
@@ -491,21 +1026,13 @@ class GerenciadorLog:
         logger = self.get_logger(f"{origem}_ERROR", "erros", nivel=logging.ERROR)
         
         # Monta mensagem detalhada
-        msg_completa = f"[{origem}] ERRO: {mensagem}"
-        
         if detalhes:
-            detalhes_str = ", ".join([f"{k}={v}" for k, v in detalhes.items()])
-            msg_completa += f" | Detalhes: {detalhes_str}"
-        
-        if exc_info:
-            logger.error(msg_completa, exc_info=True)
+            logger.error(
+                "[%s] ERRO: %s | Detalhes: %s", origem, mensagem, _LazyDetails(detalhes, "="),
+                exc_info=exc_info,
+            )
         else:
-            logger.error(msg_completa)
-        
-        # Força flush para garantir que o erro seja escrito imediatamente
-        for handler in logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
+            logger.error("[%s] ERRO: %s", origem, mensagem, exc_info=exc_info)
     
     def log_erro_critico(
         self, 
@@ -524,21 +1051,16 @@ class GerenciadorLog:
             detalhes: Dicionário com detalhes adicionais (opcional)
         """
         logger = self.get_logger("ERROS_SISTEMA", "critical", logging.CRITICAL)
+        if not logger.isEnabledFor(logging.CRITICAL):
+            return
         
-        mensagem_completa = mensagem
         if detalhes:
-            detalhes_str = ", ".join([f"{k}: {v}" for k, v in detalhes.items()])
-            mensagem_completa = f"{mensagem} | Detalhes: {detalhes_str}"
-        
-        logger.critical(
-            f"[{plugin_name}] [ERRO_CRITICO] {mensagem_completa}",
-            exc_info=exc_info
-        )
-        
-        # Força flush para garantir que o log crítico seja escrito imediatamente
-        for handler in logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
+            logger.critical(
+                "[%s] [ERRO_CRITICO] %s | Detalhes: %s", plugin_name, mensagem, _LazyDetails(detalhes),
+                exc_info=exc_info
+            )
+        else:
+            logger.critical("[%s] [ERRO_CRITICO] %s", plugin_name, mensagem, exc_info=exc_info)
 
     def log_inicializacao(self, componente: str, sucesso: bool, detalhes: Optional[Dict[str, Any]] = None):
         """
@@ -712,29 +1234,28 @@ class GerenciadorLog:
             porcentagem_sucesso: Porcentagem de sucesso do padrão (futuro, opcional)
             detalhes: Detalhes adicionais (opcional)
         """
-        partes = [f"Padrão detectado: {nome_padrao}"]
-        partes.append(f"Moeda: {moeda}")
-        partes.append(f"Timeframe: {timeframe}")
-        partes.append(f"Direção: {direcao}")
+        logger = self.get_logger("PluginPadroes", "padroes", nivel=logging.INFO)
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
+        # Template %-style montado a partir dos campos presentes; o texto final
+        # só é gerado quando o record for formatado
+        formato = "Padrão detectado: %s | Moeda: %s | Timeframe: %s | Direção: %s"
+        args = [nome_padrao, moeda, timeframe, direcao]
         if score is not None:
-            partes.append(f"Score: {score:.4f}")
+            formato += " | Score: %.4f"
+            args.append(score)
         if confidence is not None:
-            partes.append(f"Confidence: {confidence:.4f}")
+            formato += " | Confidence: %.4f"
+            args.append(confidence)
         if porcentagem_sucesso is not None:
-            partes.append(f"Sucesso: {porcentagem_sucesso:.2f}%")
-        
-        mensagem = " | ".join(partes)
-        
+            formato += " | Sucesso: %.2f%%"
+            args.append(porcentagem_sucesso)
         if detalhes:
-            detalhes_str = ", ".join([f"{k}: {v}" for k, v in detalhes.items()])
-            mensagem += f" | Detalhes: {detalhes_str}"
+            formato += " | Detalhes: %s"
+            args.append(_LazyDetails(detalhes))
         
-        logger = self.get_logger("PluginPadroes", "padroes", nivel=logging.INFO)
-        logger.info(mensagem)
-        for handler in logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
+        logger.info(formato, *args)
     
     def log_sinal(
         self,
@@ -758,28 +1279,59 @@ class GerenciadorLog:
             quantidade: Quantidade do sinal (opcional)
             detalhes: Detalhes adicionais (opcional)
         """
-        partes = [f"Sinal: {tipo_sinal}"]
-        partes.append(f"Moeda: {moeda}")
-        partes.append(f"Direção: {direcao}")
+        logger = self.get_logger("GerenciadorBot", "sinais", nivel=logging.INFO)
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
+        formato = "Sinal: %s | Moeda: %s | Direção: %s"
+        args = [tipo_sinal, moeda, direcao]
         if timeframe:
-            partes.append(f"Timeframe: {timeframe}")
+            formato += " | Timeframe: %s"
+            args.append(timeframe)
         if preco is not None:
-            partes.append(f"Preço: {preco:.8f}")
+            formato += " | Preço: %.8f"
+            args.append(preco)
         if quantidade is not None:
-            partes.append(f"Quantidade: {quantidade:.8f}")
-        
-        mensagem = " | ".join(partes)
-        
+            formato += " | Quantidade: %.8f"
+            args.append(quantidade)
         if detalhes:
-            detalhes_str = ", ".join([f"{k}: {v}" for k, v in detalhes.items()])
-            mensagem += f" | Detalhes: {detalhes_str}"
+            formato += " | Detalhes: %s"
+            args.append(_LazyDetails(detalhes))
         
-        logger = self.get_logger("GerenciadorBot", "sinais", nivel=logging.INFO)
-        logger.info(mensagem)
-        for handler in logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
+        logger.info(formato, *args)
+
+    def _limpeza_periodica(self, intervalo: float = 3600.0):
+        """
+        Loop da thread de limpeza: descarta compactações interrompidas e
+        aplica a retenção na inicialização e depois a cada `intervalo` segundos.
+        """
+        try:
+            self._remover_compactacoes_parciais()
+        except OSError:
+            pass
+        while True:
+            try:
+                self._limpar_logs_antigos()
+            except Exception:
+                pass
+            if self._parar_flush.wait(intervalo):
+                return
+
+    def _remover_compactacoes_parciais(self):
+        """Remove arquivos .gz.tmp deixados por uma compactação interrompida (processo morto no meio)."""
+        try:
+            with os.scandir(self.base_path) as entradas:
+                diretorios = [entrada.path for entrada in entradas if entrada.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            return
+        for diretorio in diretorios:
+            with os.scandir(diretorio) as entradas:
+                parciais = [entrada.path for entrada in entradas if entrada.name.endswith(".gz.tmp")]
+            for caminho in parciais:
+                try:
+                    os.unlink(caminho)
+                except OSError:
+                    pass
 
     def _limpar_logs_antigos(self):
         """
@@ -789,58 +1341,120 @@ class GerenciadorLog:
         - Compacta logs mais antigos que retencao_arquivo_dias
         - Remove logs compactados muito antigos
         """
-        agora = datetime.now(self.timezone_sp)
+        # Só a diferença em dias importa: ordinal da data (inteiro), sem timezone por arquivo
+        hoje = datetime.now(self.timezone_sp).date().toordinal()
+        # Mesmas datas se repetem entre os tipos: data_str -> dias, compartilhado pelas threads
+        dias_por_data: Dict[str, int] = {}
+        # Diretórios são independentes: varre/compacta em paralelo
+        with ThreadPoolExecutor(max_workers=min(len(self._TIPOS_VALIDOS), os.cpu_count() or 1)) as executor:
+            list(executor.map(
+                lambda tipo_log: self._limpar_um_diretorio(tipo_log, hoje, dias_por_data),
+                self._TIPOS_VALIDOS,
+            ))
+
+    def _limpar_um_diretorio(self, tipo_log: str, hoje: int, dias_por_data: Dict[str, int]):
+        """
+        Aplica a política de retenção aos arquivos de um diretório de log.
+        
+        Args:
+            tipo_log: Tipo de log (nome do diretório)
+            hoje: Ordinal da data de referência (timezone de São Paulo)
+            dias_por_data: Cache data_str -> dias desde a data
+        """
+        diretorio = self._dirs[tipo_log]
         
-        for tipo_log in ["spot", "futures", "ia", "system", "banco", "sinais", "erros", "warnings", "critical", "padroes"]:
-            diretorio = self.base_path / tipo_log
-            if not diretorio.exists():
+        # scandir: tipo e nome vêm da própria leitura do diretório (sem stat por arquivo)
+        try:
+            with os.scandir(diretorio) as entradas:
+                arquivos = [
+                    entrada.name for entrada in entradas
+                    if entrada.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return
+        
+        # 1ª passada: só classifica (nenhuma operação de disco no meio do parse)
+        para_compactar = []
+        para_remover = []
+        for nome in arquivos:
+            # Ignora arquivos compactados (ou em compactação) e backups
+            if nome.endswith((".gz", ".zip", ".tmp")):
+                continue
+            if ".log." in nome:  # Backups do RotatingFileHandler
                 continue
             
-            for arquivo in diretorio.iterdir():
-                if not arquivo.is_file():
-                    continue
-                
-                # Ignora arquivos compactados e backups
-                if arquivo.suffix in [".gz", ".zip"]:
-                    continue
-                if ".log." in arquivo.name:  # Backups do RotatingFileHandler
-                    continue
-                
-                # Extrai data do nome do arquivo (formato: {tipo_log}_2025-11-02.log)
-                try:
-                    nome_base = arquivo.stem  # Remove .log
-                    # Remove o prefixo do tipo de log (ex: "system_2025-11-02" -> "2025-11-02")
-                    if "_" in nome_base:
-                        # Formato novo: {tipo_log}_YYYY-MM-DD
-                        partes = nome_base.split("_", 1)
-                        if len(partes) == 2 and len(partes[1]) == 10:  # Verifica se tem formato de data
-                            data_str = partes[1]
-                        else:
-                            # Formato antigo: YYYY-MM-DD (compatibilidade)
-                            data_str = nome_base
+            # Extrai data do nome do arquivo (formato: {tipo_log}_2025-11-02.log)
+            try:
+                nome_base = os.path.splitext(nome)[0]  # Remove .log
+                # Remove o prefixo do tipo de log (ex: "system_2025-11-02" -> "2025-11-02")
+                if "_" in nome_base:
+                    # Formato novo: {tipo_log}_YYYY-MM-DD
+                    partes = nome_base.split("_", 1)
+                    if len(partes) == 2 and len(partes[1]) == 10:  # Verifica se tem formato de data
+                        data_str = partes[1]
                     else:
                         # Formato antigo: YYYY-MM-DD (compatibilidade)
                         data_str = nome_base
+                else:
+                    # Formato antigo: YYYY-MM-DD (compatibilidade)
+                    data_str = nome_base
+                
+                dias_diferenca = dias_por_data.get(data_str)
+                if dias_diferenca is None:
+                    m = _DATE_RE.match(data_str)
+                    if not m:
+                        continue
+                    dias_diferenca = hoje - date(int(m[1]), int(m[2]), int(m[3])).toordinal()
+                    dias_por_data[data_str] = dias_diferenca
+                
+                # Se mais antigo que retencao_dias, compacta ou remove
+                if dias_diferenca > self.retencao_arquivo_dias:
+                    para_compactar.append(nome)
+                elif dias_diferenca > self.retencao_dias:
+                    # Remove logs muito antigos (mais de retencao_dias dias)
+                    para_remover.append(os.path.join(diretorio, nome))
                     
-                    data_naive = datetime.strptime(data_str, "%Y-%m-%d")
-                    data_arquivo = self.timezone_sp.localize(data_naive)
-                    dias_diferenca = (agora - data_arquivo).days
-                    
-                    # Se mais antigo que retencao_dias, compacta ou remove
-                    if dias_diferenca > self.retencao_arquivo_dias:
-                        # Compacta
-                        with open(arquivo, 'rb') as f_in:
-                            arquivo_gz = arquivo.with_suffix('.log.gz')
-                            with gzip.open(arquivo_gz, 'wb') as f_out:
-                                shutil.copyfileobj(f_in, f_out)
-                        arquivo.unlink()
-                        self.loggers.get("SYSTEM_system", logging.getLogger("SYSTEM")).info(
-                            f"Log compactado: {arquivo.name} → {arquivo_gz.name}"
-                        )
-                    elif dias_diferenca > self.retencao_dias:
-                        # Remove logs muito antigos (mais de retencao_dias dias)
-                        arquivo.unlink()
-                        
-                except (ValueError, AttributeError):
-                    # Se não conseguir parsear a data, mantém o arquivo
-                    pass
+            except (ValueError, AttributeError):
+                # Se não conseguir parsear a data, mantém o arquivo
+                pass
+        
+        # 2ª passada: remoções em sequência, depois compactações
+        for caminho in para_remover:
+            try:
+                os.unlink(caminho)
+            except FileNotFoundError:
+                pass
+        for nome in para_compactar:
+            self._compactar_arquivo(diretorio, nome)
+        
+        # Um único fsync do diretório persiste todas as remoções/renomeações
+        if para_remover or para_compactar:
+            _sincronizar_diretorio(diretorio)
+
+    def _compactar_arquivo(self, diretorio: Path, nome: str):
+        """
+        Compacta um log em {nome}.gz e remove o original.
+        
+        Args:
+            diretorio: Diretório do arquivo
+            nome: Nome do arquivo de log
+        """
+        # Compacta em um .tmp e só então publica o .gz (os.replace é atômico)
+        arquivo = diretorio / nome
+        arquivo_gz = arquivo.with_name(nome + ".gz")
+        arquivo_tmp = arquivo_gz.with_name(arquivo_gz.name + ".tmp")
+        with self._lock_compactacao:
+            if arquivo in self._compactando:
+                return
+            self._compactando.add(arquivo)
+        try:
+            # Nível 1 (padrão): texto de log repetitivo comprime quase igual, bem mais rápido
+            _compactar_gzip(arquivo, arquivo_tmp, self.nivel_compactacao)
+            os.replace(arquivo_tmp, arquivo_gz)
+            arquivo.unlink()
+        finally:
+            with self._lock_compactacao:
+                self._compactando.discard(arquivo)
+        self.loggers.get(("SYSTEM", "system"), logging.getLogger("SYSTEM")).info(
+            "Log compactado: %s → %s", nome, arquivo_gz.name
+        )
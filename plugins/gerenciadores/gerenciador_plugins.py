@@ -8,15 +8,37 @@ Orquestra o ciclo de vida dos plugins:
 - Inicialização e finalização
 """
 
-from typing import Dict, Any, Optional, List, Type
+from typing import Dict, Any, Optional, List, Tuple, Type
 from pathlib import Path
+import heapq
 import importlib
 import inspect
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from plugins.gerenciadores.gerenciador import GerenciadorBase
+from plugins.gerenciadores.gerenciador_log import CategoriaLog
 from plugins.base_plugin import Plugin
 import json
 
 
+class CicloDependenciaError(ValueError):
+    """
+    Ciclo no grafo de dependências entre plugins.
+    
+    Attributes:
+        plugins (list): Plugins que ficaram sem ordem (participam do ciclo ou
+            dependem de quem participa), na ordem de registro
+    """
+
+    def __init__(self, plugins: List[str]):
+        self.plugins = plugins
+        super().__init__(
+            f"Ciclo de dependências entre plugins: {', '.join(plugins)}"
+        )
+
+
 class GerenciadorPlugins(GerenciadorBase):
     """
     Gerenciador de plugins do sistema.
@@ -34,6 +56,7 @@ class GerenciadorPlugins(GerenciadorBase):
         plugins (dict): Dicionário de plugins carregados {nome: instância}
         dependencias (dict): Grafo de dependências entre plugins
         ordem_execucao (list): Ordem de execução calculada
+        niveis_execucao (list): Plugins executáveis agrupados por nível de dependência
     """
 
     GERENCIADOR_NAME: str = "GerenciadorPlugins"
@@ -60,6 +83,21 @@ class GerenciadorPlugins(GerenciadorBase):
         self.plugins: Dict[str, Plugin] = {}
         self.dependencias: Dict[str, List[str]] = {}
         self.ordem_execucao: List[str] = []
+        # Adjacência reversa (dependência -> dependentes), mantida no registro
+        self._sucessores: Dict[str, List[str]] = {}
+        # Partição por tipo feita no registro: AUXILIAR e IA não rodam no ciclo
+        self._plugins_auxiliar: set = set()
+        self._plugins_ia: set = set()
+        # ordem_execucao sem os plugins AUXILIAR/IA (é o que executar_plugins percorre)
+        self._plugins_executaveis: List[str] = []
+        # Mesmos plugins agrupados por nível topológico (sem dependência entre si)
+        self.niveis_execucao: List[List[str]] = []
+        # Ordem só é recalculada quando um plugin novo é registrado
+        self._ordem_dirty: bool = True
+        # Incrementado a cada nova ordem calculada
+        self._ordem_versao: int = 0
+        # Classes já validadas como Plugin (evita percorrer o MRO a cada registro)
+        self._tipos_plugin_ok: set = set()
         
         self.logger = None
 
@@ -105,13 +143,16 @@ class GerenciadorPlugins(GerenciadorBase):
             bool: True se registrado com sucesso, False caso contrário.
         """
         try:
-            if not isinstance(plugin, Plugin):
-                if self.logger:
-                    self.logger.error(
-                        f"[{self.GERENCIADOR_NAME}] Tentativa de registrar objeto "
-                        f"que não é Plugin: {type(plugin)}"
-                    )
-                return False
+            tipo_plugin = type(plugin)
+            if tipo_plugin not in self._tipos_plugin_ok:
+                if not isinstance(plugin, Plugin):
+                    if self.logger:
+                        self.logger.error(
+                            f"[{self.GERENCIADOR_NAME}] Tentativa de registrar objeto "
+                            f"que não é Plugin: {tipo_plugin}"
+                        )
+                    return False
+                self._tipos_plugin_ok.add(tipo_plugin)
 
             nome = plugin.PLUGIN_NAME
             
@@ -135,8 +176,21 @@ class GerenciadorPlugins(GerenciadorBase):
                     )
                 return False
 
-            # Registra
+            # Registra (dependências declaradas nos metadados do plugin)
             self.plugins[nome] = plugin
+            dependencias = list(
+                getattr(plugin, "plugin_metadados", {}).get("dependencias", [])
+            )
+            self.dependencias[nome] = dependencias
+            for dependencia in dependencias:
+                if dependencia != nome:
+                    self._sucessores.setdefault(dependencia, []).append(nome)
+            tipo = getattr(getattr(plugin, "plugin_tipo", None), "value", None)
+            if tipo == "auxiliar":
+                self._plugins_auxiliar.add(nome)
+            elif tipo == "ia":
+                self._plugins_ia.add(nome)
+            self._ordem_dirty = True
 
             if self.logger:
                 self.logger.debug(
@@ -179,190 +233,157 @@ class GerenciadorPlugins(GerenciadorBase):
                     "total_erros": 0,
                 }
 
+            # Logger e nível DEBUG resolvidos uma vez por ciclo
+            logger = self.logger
+            debug = logger is not None and logger.isEnabledFor(logging.DEBUG)
+
             resultados = {}
             dados_atuais = dados_entrada or {}
             plugins_executados = []
             plugins_com_erro = []
+            # Métricas de tempo acumuladas durante a execução
+            tempos_execucao = {}
+            tempo_total_ns = 0
 
-            # Calcula ordem de execução se necessário
-            if not self.ordem_execucao:
-                self._calcular_ordem_execucao()
+            # Calcula ordem de execução se necessário (plugin novo desde o último cálculo)
+            if self._ordem_dirty:
+                try:
+                    self._calcular_ordem_execucao()
+                except CicloDependenciaError as e:
+                    # Registrado uma vez: a ordem de registro vale até o próximo registro
+                    if logger:
+                        logger.error(
+                            f"[{self.GERENCIADOR_NAME}] {e}. Executando na ordem de registro"
+                        )
+                    self._usar_ordem_de_registro()
             
             # Log de diagnóstico: mostra todos os plugins registrados
-            if self.logger:
+            if debug:
                 total_registrados = len(self.plugins)
                 plugins_registrados = list(self.plugins.keys())
                 plugins_na_ordem = list(self.ordem_execucao)
-                self.logger.debug(
+                logger.debug(
                     f"[{self.GERENCIADOR_NAME}] DEBUG — Plugins registrados: {total_registrados} "
                     f"({', '.join(plugins_registrados)})"
                 )
-                self.logger.debug(
+                logger.debug(
                     f"[{self.GERENCIADOR_NAME}] DEBUG — Ordem de execução: {len(plugins_na_ordem)} "
                     f"({', '.join(plugins_na_ordem)})"
                 )
 
-            # Executa plugins na ordem
-            plugins_pulados = []
-            for nome_plugin in self.ordem_execucao:
-                if nome_plugin not in self.plugins:
-                    plugins_pulados.append(f"{nome_plugin} (não encontrado)")
-                    continue
-
-                plugin = self.plugins[nome_plugin]
-
-                try:
-                    # Pula plugins AUXILIAR - eles são executados sob demanda por outros plugins
-                    # (ex: PluginFiltroDinamico é chamado pelo PluginDadosVelas)
-                    # Pula plugins IA - eles são executados no final do ciclo após todos os pares
-                    if hasattr(plugin, 'plugin_tipo'):
-                        if plugin.plugin_tipo.value == "auxiliar":
-                            plugins_pulados.append(f"{nome_plugin} (auxiliar)")
-                            if self.logger:
-                                self.logger.debug(
-                                    f"[{self.GERENCIADOR_NAME}] Pulando plugin auxiliar '{nome_plugin}' "
-                                    f"(executado sob demanda)"
-                                )
-                            continue
-                        elif plugin.plugin_tipo.value == "ia":
-                            plugins_pulados.append(f"{nome_plugin} (ia)")
-                            if self.logger:
-                                self.logger.debug(
-                                    f"[{self.GERENCIADOR_NAME}] Pulando plugin IA '{nome_plugin}' "
-                                    f"(executado no final do ciclo)"
-                                )
-                            continue
-                    
-                    # Verifica se plugin já está em execução
-                    if plugin.esta_em_execucao:
-                        if self.logger:
-                            self.logger.warning(
-                                f"[{self.GERENCIADOR_NAME}] Plugin '{nome_plugin}' já está em execução. Pulando..."
-                            )
-                        continue
-                    
-                    # Log DEBUG apenas (reduz spam - execução de plugins é rotina)
-                    if self.logger:
-                        self.logger.debug(
-                            f"[{self.GERENCIADOR_NAME}] ▶ Executando plugin '{nome_plugin}'"
+            # Pula plugins AUXILIAR - eles são executados sob demanda por outros plugins
+            # (ex: PluginFiltroDinamico é chamado pelo PluginDadosVelas)
+            # Pula plugins IA - eles são executados no final do ciclo após todos os pares
+            # (já separados no registro; aqui só o log de diagnóstico)
+            plugins_pulados: List[Tuple[str, str]] = []  # (nome, motivo)
+            if debug:
+                for nome_plugin in self.ordem_execucao:
+                    if nome_plugin in self._plugins_auxiliar:
+                        plugins_pulados.append((nome_plugin, "auxiliar"))
+                        logger.debug(
+                            f"[{self.GERENCIADOR_NAME}] Pulando plugin auxiliar '{nome_plugin}' "
+                            f"(executado sob demanda)"
+                        )
+                    elif nome_plugin in self._plugins_ia:
+                        plugins_pulados.append((nome_plugin, "ia"))
+                        logger.debug(
+                            f"[{self.GERENCIADOR_NAME}] Pulando plugin IA '{nome_plugin}' "
+                            f"(executado no final do ciclo)"
                         )
 
-                    # Mede tempo de execução (usa perf_counter para maior precisão)
-                    import time
-                    tempo_inicio = time.perf_counter()
-                    
-                    # Executa plugin (executar() já tem @execucao_segura quando aplicável)
-                    resultado = plugin.executar(dados_atuais)
-                    
-                    tempo_fim = time.perf_counter()
-                    tempo_execucao_ms = (tempo_fim - tempo_inicio) * 1000
-                    
-                    # Garante que resultado é um dict antes de adicionar tempo
-                    if resultado is None:
-                        resultado = {"status": "ok", "plugin": nome_plugin}
-                    elif not isinstance(resultado, dict):
-                        resultado = {"status": "ok", "plugin": nome_plugin, "resultado_original": resultado}
-                    
-                    resultado["tempo_execucao_ms"] = tempo_execucao_ms
-                    resultados[nome_plugin] = resultado
-                    
-                    # Log DEBUG: Tempo de execução por plugin
-                    if self.logger:
-                        status_resultado = resultado.get("status", "unknown") if isinstance(resultado, dict) else "unknown"
-                        # Log mais detalhado para tempos muito baixos (usa mais casas decimais com perf_counter)
-                        if tempo_execucao_ms < 0.1:
-                            # Tempo muito pequeno - mostra com 4 casas decimais
-                            self.logger.debug(
-                                f"[{self.GERENCIADOR_NAME}] DEBUG — Tempo de execução — {nome_plugin}: {tempo_execucao_ms:.4f} ms "
-                                f"(processamento muito rápido - dados em memória)"
-                            )
-                        elif tempo_execucao_ms < 1.0:
-                            # Tempo pequeno - mostra com 3 casas decimais
-                            self.logger.debug(
-                                f"[{self.GERENCIADOR_NAME}] DEBUG — Tempo de execução — {nome_plugin}: {tempo_execucao_ms:.3f} ms "
-                                f"(processamento rápido)"
+            # Executa plugins na ordem. Com processamento.plugins_paralelos, plugins
+            # do mesmo nível topológico rodam em paralelo (todos recebem os dados
+            # do nível anterior); sem a opção, cada plugin é um nível.
+            if self.config.get("processamento", {}).get("plugins_paralelos", False):
+                niveis = self.niveis_execucao
+            else:
+                niveis = [[nome] for nome in self._plugins_executaveis]
+            plugins = self.plugins
+            for nivel in niveis:
+                futuros = None
+                if len(nivel) > 1:
+                    with ThreadPoolExecutor(
+                        max_workers=min(len(nivel), (os.cpu_count() or 1) * 2)
+                    ) as executor:
+                        futuros = {
+                            nome: executor.submit(
+                                self._executar_plugin, nome, plugins[nome], dados_atuais, debug
                             )
+                            for nome in nivel
+                        }
+
+                for nome_plugin in nivel:
+                    try:
+                        if futuros is not None:
+                            execucao = futuros[nome_plugin].result()
                         else:
-                            # Tempo normal - mostra com 2 casas decimais
-                            self.logger.debug(
-                                f"[{self.GERENCIADOR_NAME}] DEBUG — Tempo de execução — {nome_plugin}: {tempo_execucao_ms:.2f} ms"
+                            plugin = plugins.get(nome_plugin)
+                            if plugin is None:
+                                plugins_pulados.append((nome_plugin, "não encontrado"))
+                                continue
+                            execucao = self._executar_plugin(
+                                nome_plugin, plugin, dados_atuais, debug
                             )
-                        # Log DEBUG apenas (reduz spam - execução de plugins é rotina)
-                        self.logger.debug(
-                            f"[{self.GERENCIADOR_NAME}] ✓ Plugin '{nome_plugin}' executado com status: {status_resultado}"
-                        )
-                    
-                    # Verifica status
-                    if resultado and isinstance(resultado, dict):
-                        if resultado.get("status") == "ok":
-                            plugins_executados.append(nome_plugin)
-                        elif resultado.get("status") == "erro":
-                            plugins_com_erro.append(nome_plugin)
+                        if execucao is None:
+                            # Já estava em execução
+                            continue
+                        resultado, tempo_ns = execucao
+                        resultados[nome_plugin] = resultado
+                        tempos_execucao[nome_plugin] = resultado["tempo_execucao_ms"]
+                        tempo_total_ns += tempo_ns
                         
-                        # Atualiza dados para próximo plugin (apenas dados válidos)
-                        if resultado.get("status") == "ok":
+                        # Verifica status (resultado já normalizado para dict;
+                        # "status" pode faltar em dicts devolvidos pelo plugin)
+                        status = resultado.get("status")
+                        if status == "ok":
+                            plugins_executados.append(nome_plugin)
+                            # Atualiza dados para próximo plugin (apenas dados válidos)
                             dados_atuais.update(resultado)
-                    else:
-                        plugins_executados.append(nome_plugin)
-                except Exception as e:
-                    plugins_com_erro.append(nome_plugin)
-                    if self.logger:
-                        self.logger.error(
-                            f"[{self.GERENCIADOR_NAME}] Erro ao executar plugin "
-                            f"'{nome_plugin}': {e}",
-                            exc_info=True,
-                        )
-                    resultados[nome_plugin] = {
-                        "status": "erro",
-                        "mensagem": str(e),
-                        "plugin": nome_plugin
-                    }
+                        elif status == "erro":
+                            plugins_com_erro.append(nome_plugin)
+                    except Exception as e:
+                        plugins_com_erro.append(nome_plugin)
+                        if logger:
+                            logger.error(
+                                f"[{self.GERENCIADOR_NAME}] Erro ao executar plugin "
+                                f"'{nome_plugin}': {e}",
+                                exc_info=True,
+                            )
+                        resultados[nome_plugin] = {
+                            "status": "erro",
+                            "mensagem": str(e),
+                            "plugin": nome_plugin
+                        }
+            # Total somado em ns (inteiro, sem erro de arredondamento acumulado)
+            tempo_total_ms = tempo_total_ns / 1_000_000
 
-            # Calcula métricas consolidadas
-            tempos_execucao = {}
-            tempo_total_ms = 0
-            for nome_plugin, resultado in resultados.items():
-                if isinstance(resultado, dict) and "tempo_execucao_ms" in resultado:
-                    tempo_ms = resultado["tempo_execucao_ms"]
-                    tempos_execucao[nome_plugin] = tempo_ms
-                    tempo_total_ms += tempo_ms
-            
             # Log DEBUG: Métricas consolidadas de tempo
-            if self.logger and tempos_execucao:
+            if debug and tempos_execucao:
                 tempos_str = ", ".join([f"{nome}: {tempo:.2f}ms" for nome, tempo in tempos_execucao.items()])
-                self.logger.debug(
+                logger.debug(
                     f"[{self.GERENCIADOR_NAME}] DEBUG — Tempo de execução por plugin: {tempos_str} — Total: {tempo_total_ms:.2f} ms"
                 )
             
-            # Extrai nomes dos plugins pulados intencionalmente (auxiliar/ia)
-            # Formato: "PluginNome (auxiliar)" ou "PluginNome (ia)"
-            plugins_pulados_intencionalmente = set()
-            for item in plugins_pulados:
-                if " (auxiliar)" in item or " (ia)" in item:
-                    nome_plugin = item.split(" (")[0]
-                    plugins_pulados_intencionalmente.add(nome_plugin)
-            
-            # Identifica plugins não executados (excluindo os pulados intencionalmente)
+            # Identifica plugins não executados (excluindo os pulados intencionalmente:
+            # auxiliar/ia). Conjunto único para teste de pertinência O(1)
+            plugins_tratados = set(plugins_executados).union(
+                plugins_com_erro, self._plugins_auxiliar, self._plugins_ia
+            )
             plugins_nao_executados = [
-                nome for nome in self.plugins.keys() 
-                if nome not in plugins_executados 
-                and nome not in plugins_com_erro
-                and nome not in plugins_pulados_intencionalmente
+                nome for nome in self.plugins if nome not in plugins_tratados
             ]
             
             # Log de diagnóstico: mostra plugins pulados
-            if plugins_pulados and self.logger:
-                self.logger.debug(
+            if debug and plugins_pulados:
+                logger.debug(
                     f"[{self.GERENCIADOR_NAME}] DEBUG — Plugins pulados: {len(plugins_pulados)} "
-                    f"({', '.join(plugins_pulados)})"
+                    f"({', '.join(f'{nome} ({motivo})' for nome, motivo in plugins_pulados)})"
                 )
             
             # Log INFO: Identifica plugins não executados (usa categoria PLUGIN)
             # Só loga se houver plugins realmente não executados (não os pulados intencionalmente)
             if plugins_nao_executados:
                 if self.gerenciador_log:
-                    from plugins.gerenciadores.gerenciador_log import CategoriaLog
-                    import logging
                     self.gerenciador_log.log_categoria(
                         categoria=CategoriaLog.PLUGIN,
                         nome_origem=self.GERENCIADOR_NAME,
@@ -404,16 +425,142 @@ class GerenciadorPlugins(GerenciadorBase):
                 "total_erros": len(self.plugins),
             }
 
+    def _executar_plugin(
+        self,
+        nome_plugin: str,
+        plugin: Plugin,
+        dados: Dict[str, Any],
+        debug: bool,
+    ) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        Executa um plugin e normaliza o resultado.
+        
+        Args:
+            nome_plugin: Nome do plugin
+            plugin: Instância do plugin
+            dados: Dados de entrada do plugin
+            debug: Se o nível DEBUG está habilitado no logger
+            
+        Returns:
+            tuple: (resultado, tempo_ns) - resultado sempre dict, com
+            tempo_execucao_ms - ou None se o plugin já estava em execução.
+            Exceções do plugin são propagadas.
+        """
+        logger = self.logger
+        # Verifica se plugin já está em execução
+        if plugin.esta_em_execucao:
+            if logger:
+                logger.warning(
+                    f"[{self.GERENCIADOR_NAME}] Plugin '{nome_plugin}' já está em execução. Pulando..."
+                )
+            return None
+        
+        # Log DEBUG apenas (reduz spam - execução de plugins é rotina)
+        if debug:
+            logger.debug(
+                f"[{self.GERENCIADOR_NAME}] ▶ Executando plugin '{nome_plugin}'"
+            )
+
+        # Mede tempo de execução (perf_counter_ns: inteiro, convertido para ms uma vez)
+        tempo_inicio = time.perf_counter_ns()
+        
+        # Executa plugin (executar() já tem @execucao_segura quando aplicável)
+        resultado = plugin.executar(dados)
+        
+        tempo_ns = time.perf_counter_ns() - tempo_inicio
+        tempo_execucao_ms = tempo_ns / 1_000_000
+        
+        # Garante que resultado é um dict antes de adicionar tempo
+        if resultado is None:
+            resultado = {"status": "ok", "plugin": nome_plugin}
+        elif not isinstance(resultado, dict):
+            resultado = {"status": "ok", "plugin": nome_plugin, "resultado_original": resultado}
+        
+        resultado["tempo_execucao_ms"] = tempo_execucao_ms
+        
+        # Log DEBUG: Tempo de execução e status por plugin (formatação adiada pelo logging)
+        if debug:
+            logger.debug(
+                "[%s] ✓ Plugin '%s' executado com status: %s — Tempo de execução: %.4f ms",
+                self.GERENCIADOR_NAME,
+                nome_plugin,
+                resultado.get("status", "unknown"),
+                tempo_execucao_ms,
+            )
+        
+        return resultado, tempo_ns
+
     def _calcular_ordem_execucao(self):
         """
         Calcula a ordem de execução dos plugins baseado em dependências.
         
-        Usa ordenação topológica para garantir que dependências sejam executadas antes.
+        Usa ordenação topológica (Kahn) para garantir que dependências sejam
+        executadas antes. Entre plugins prontos, vale a ordem de registro (heap
+        pelo índice de registro), então sem dependências a ordem não muda.
+        Dependências de plugins não registrados são ignoradas. Os sucessores
+        vêm de self._sucessores, mantido em registrar_plugin.
+        
+        Raises:
+            CicloDependenciaError: Se houver ciclo de dependências
+        """
+        plugins = self.plugins
+        sucessores = self._sucessores
+        indice = {nome: i for i, nome in enumerate(plugins)}
+        # Grau de entrada: dependências registradas de cada plugin
+        grau_entrada = {
+            nome: sum(
+                1 for dependencia in self.dependencias.get(nome, ())
+                if dependencia in plugins and dependencia != nome
+            )
+            for nome in plugins
+        }
+        
+        prontos = [(indice[nome], nome) for nome, grau in grau_entrada.items() if grau == 0]
+        heapq.heapify(prontos)
+        ordem = []
+        # Nível = 1 + maior nível entre as dependências
+        nivel = dict.fromkeys(plugins, 0)
+        while prontos:
+            _, nome = heapq.heappop(prontos)
+            ordem.append(nome)
+            for sucessor in sucessores.get(nome, ()):
+                if nivel[sucessor] <= nivel[nome]:
+                    nivel[sucessor] = nivel[nome] + 1
+                grau_entrada[sucessor] -= 1
+                if grau_entrada[sucessor] == 0:
+                    heapq.heappush(prontos, (indice[sucessor], sucessor))
+        
+        if len(ordem) < len(plugins):
+            raise CicloDependenciaError(
+                [nome for nome in plugins if grau_entrada[nome] > 0]
+            )
+        
+        self.ordem_execucao = ordem
+        pulados = self._plugins_auxiliar | self._plugins_ia
+        self._plugins_executaveis = [nome for nome in ordem if nome not in pulados]
+        niveis: List[List[str]] = []
+        for nome in self._plugins_executaveis:
+            while len(niveis) <= nivel[nome]:
+                niveis.append([])
+            niveis[nivel[nome]].append(nome)
+        self.niveis_execucao = [grupo for grupo in niveis if grupo]
+        self._ordem_versao += 1
+        self._ordem_dirty = False
+
+    def _usar_ordem_de_registro(self):
+        """
+        Adota a ordem de registro quando as dependências têm ciclo.
+        
+        Sem ordem topológica válida, cada plugin vira seu próprio nível (nada
+        roda em paralelo). A ordem é marcada como calculada para o ciclo não
+        ser reavaliado (e logado) a cada execução, só no próximo registro.
         """
-        # Por enquanto, executa na ordem de registro
-        # Pode ser expandido para usar ordenação topológica quando dependências
-        # forem declaradas pelos plugins
-        self.ordem_execucao = list(self.plugins.keys())
+        self.ordem_execucao = list(self.plugins)
+        pulados = self._plugins_auxiliar | self._plugins_ia
+        self._plugins_executaveis = [nome for nome in self.ordem_execucao if nome not in pulados]
+        self.niveis_execucao = [[nome] for nome in self._plugins_executaveis]
+        self._ordem_versao += 1
+        self._ordem_dirty = False
 
     def executar(self, *args, **kwargs):
         """
@@ -429,6 +576,18 @@ class GerenciadorPlugins(GerenciadorBase):
             bool: True se finalizado com sucesso, False caso contrário.
         """
         try:
+            # Ordem desatualizada (ex.: executar_plugins nunca rodou) deixaria
+            # plugins registrados sem finalizar
+            if self._ordem_dirty:
+                try:
+                    self._calcular_ordem_execucao()
+                except CicloDependenciaError as e:
+                    if self.logger:
+                        self.logger.warning(
+                            f"[{self.GERENCIADOR_NAME}] {e}. Finalizando na ordem de registro"
+                        )
+                    self._usar_ordem_de_registro()
+
             # Primeiro, solicita cancelamento em todos os plugins
             for nome_plugin in self.ordem_execucao:
                 if nome_plugin in self.plugins:
@@ -441,9 +600,12 @@ class GerenciadorPlugins(GerenciadorBase):
                                 f"em plugin '{nome_plugin}': {e}"
                             )
             
-            # Aguarda um pouco para requisições em andamento terminarem
-            import time
-            time.sleep(0.3)
+            # Aguarda até 0.3s por requisições em andamento (retorna logo se não há nenhuma)
+            limite = time.monotonic() + 0.3
+            while time.monotonic() < limite and any(
+                plugin.esta_em_execucao for plugin in self.plugins.values()
+            ):
+                time.sleep(0.01)
             
             # Finaliza plugins na ordem reversa
             for nome_plugin in reversed(self.ordem_execucao):
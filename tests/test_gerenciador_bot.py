@@ -0,0 +1,209 @@
+"""Testes da validação 6/8 do GerenciadorBot contra a contagem original (dict)."""
+
+import logging
+import random
+
+import pytest
+
+from plugins.gerenciadores.gerenciador_bot import GerenciadorBot
+
+
+_PLUGIN_TO_INDICATOR = {
+    "PluginIchimoku": "ichimoku",
+    "PluginSupertrend": "supertrend",
+    "PluginBollinger": "bollinger",
+    "PluginVolume": "volume",
+    "PluginEma": "ema",
+    "PluginMacd": "macd",
+    "PluginRsi": "rsi",
+    "PluginVwap": "vwap",
+}
+
+_CHAVES_INDICADORES = [
+    "ichimoku", "supertrend", "bollinger", "volume", "EMA", "Macd", "rsi", "vwap",
+    "adx", "stoch",
+]
+_CHAVES_PLUGINS = list(_PLUGIN_TO_INDICATOR) + ["PluginAdx", "PluginStoch"]
+
+
+def _contagem_original(resultados, par=None):
+    """Reimplementação da contagem por dict anterior à máscara de bits."""
+    long_count = 0
+    short_count = 0
+    for key, value in resultados.items():
+        if isinstance(value, dict) and "dados" in value:
+            dados_plugin = value.get("dados", {})
+            if par and par in dados_plugin:
+                for tf_data in dados_plugin[par].values():
+                    if isinstance(tf_data, dict):
+                        if tf_data.get("long", False):
+                            long_count += 1
+                        if tf_data.get("short", False):
+                            short_count += 1
+        else:
+            resultado = value if isinstance(value, dict) else {}
+            if resultado.get("long", False):
+                long_count += 1
+            if resultado.get("short", False):
+                short_count += 1
+
+    neutros = 8 - long_count - short_count
+    valido = False
+    direcao = None
+    if long_count >= 6:
+        valido, direcao = True, "LONG"
+        motivo = f"{long_count}/8 indicadores LONG"
+    elif short_count >= 6:
+        valido, direcao = True, "SHORT"
+        motivo = f"{short_count}/8 indicadores SHORT"
+    elif long_count == 5 and short_count == 0 and neutros >= 3:
+        motivo = f"Empate: {long_count}/8 LONG com {neutros} neutros. Aguardando 6/8"
+    elif short_count == 5 and long_count == 0 and neutros >= 3:
+        motivo = f"Empate: {short_count}/8 SHORT com {neutros} neutros. Aguardando 6/8"
+    elif long_count == short_count and long_count > 0:
+        motivo = f"Empate exato: {long_count}L/{short_count}S. Reduzindo oscilações falsas"
+    else:
+        motivo = f"Insufficiente: {long_count}L/{short_count}S/{neutros}N"
+    return valido, direcao, long_count, short_count, neutros, motivo
+
+
+def _resumo(resultado):
+    return (
+        resultado.valido,
+        resultado.direcao,
+        resultado.contagem_long,
+        resultado.contagem_short,
+        resultado.contagem_neutros,
+        resultado.motivo,
+    )
+
+
+def _sinal_aleatorio(rng):
+    return {"long": rng.random() < 0.6, "short": rng.random() < 0.3}
+
+
+@pytest.fixture
+def bot():
+    return GerenciadorBot()
+
+
+@pytest.mark.parametrize("semente", range(200))
+def test_formato_indicadores_igual_contagem_original(bot, semente):
+    rng = random.Random(semente)
+    chaves = rng.sample(_CHAVES_INDICADORES, rng.randint(1, len(_CHAVES_INDICADORES)))
+    resultados = {chave: _sinal_aleatorio(rng) for chave in chaves}
+
+    assert _resumo(bot.validar_entrada(resultados)) == _contagem_original(resultados)
+
+
+@pytest.mark.parametrize("semente", range(200))
+def test_formato_plugins_igual_contagem_original(bot, semente):
+    rng = random.Random(semente)
+    chaves = rng.sample(_CHAVES_PLUGINS, rng.randint(1, len(_CHAVES_PLUGINS)))
+    resultados = {
+        chave: {"dados": {"BTCUSDT": {"15m": _sinal_aleatorio(rng)}}} for chave in chaves
+    }
+
+    assert (
+        _resumo(bot.validar_entrada(resultados, "BTCUSDT"))
+        == _contagem_original(resultados, "BTCUSDT")
+    )
+
+
+@pytest.mark.parametrize("semente", range(200))
+def test_formatos_misturados_igual_contagem_original(bot, semente):
+    rng = random.Random(semente)
+    resultados = {}
+    for indicador, plugin in zip(_CHAVES_INDICADORES, _CHAVES_PLUGINS):
+        formato = rng.choice(("plugin", "indicador", "nenhum"))
+        if formato == "plugin":
+            resultados[plugin] = {"dados": {"BTCUSDT": {"15m": _sinal_aleatorio(rng)}}}
+        elif formato == "indicador":
+            resultados[indicador] = _sinal_aleatorio(rng)
+        else:
+            resultados[plugin] = None
+
+    assert (
+        _resumo(bot.validar_entrada(resultados, "BTCUSDT"))
+        == _contagem_original(resultados, "BTCUSDT")
+    )
+
+
+def test_plugin_sem_resultado_nao_descarta_consenso(bot):
+    resultados = {
+        plugin: {"dados": {"BTCUSDT": {"15m": {"long": True, "short": False}}}}
+        for plugin in list(_PLUGIN_TO_INDICATOR)[1:]
+    }
+    resultados["PluginIchimoku"] = None
+
+    resultado = bot.validar_entrada(resultados, "BTCUSDT")
+
+    assert (resultado.valido, resultado.direcao, resultado.contagem_long) == (True, "LONG", 7)
+
+
+def test_entradas_planas_apos_plugin_sao_contadas(bot):
+    resultados = {"PluginEma": {"dados": {"BTCUSDT": {"15m": {"long": True}}}}}
+    for indicador in ("ichimoku", "supertrend", "bollinger", "volume", "macd", "rsi", "vwap"):
+        resultados[indicador] = {"long": True, "short": False}
+    resultados["par"] = "BTCUSDT"
+
+    resultado = bot.validar_entrada(resultados, "BTCUSDT")
+
+    assert (resultado.contagem_long, resultado.contagem_neutros) == (8, 0)
+    assert resultado.direcao == "LONG"
+
+
+def test_indicadores_desconhecidos_contam_para_consenso(bot):
+    # 4 conhecidos + 2 fora dos 8 em LONG: a contagem original chegava a 6/8
+    resultados = {
+        chave: {"long": True, "short": False}
+        for chave in ("ema", "macd", "rsi", "vwap", "adx", "stoch")
+    }
+
+    resultado = bot.validar_entrada(resultados)
+
+    assert resultado.valido
+    assert resultado.direcao == "LONG"
+    assert resultado.contagem_long == 6
+    assert resultado.motivo == "6/8 indicadores LONG"
+
+
+def test_aviso_de_indicador_desconhecido_por_instancia(caplog):
+    resultados = {"adx": {"long": True}, "ema": {"long": True}}
+
+    avisos = []
+    for _ in range(2):
+        bot = GerenciadorBot()
+        bot.logger = logging.getLogger("teste_gerenciador_bot")
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="teste_gerenciador_bot"):
+            bot.validar_entrada(resultados)
+            bot.validar_entrada(resultados)
+        avisos.append([r.getMessage() for r in caplog.records])
+
+    # Cada instância avisa uma vez por chave, sem herdar o estado da anterior
+    for mensagens in avisos:
+        assert len(mensagens) == 1
+        assert "'adx'" in mensagens[0]
+
+
+def test_calcular_risco_vec_igual_calcular_risco(bot):
+    pares = ["BTCUSDT", "ETHUSDT"]
+    resultado = bot.calcular_risco_vec(pares, [100.0, 100.0], [95.0, 105.0], [1, -1])
+
+    for i, (par, direcao) in enumerate(zip(pares, ("LONG", "SHORT"))):
+        individual = bot.calcular_risco(par, 100.0, resultado["sl"][i], direcao)
+        for chave, valor in individual.items():
+            assert resultado[chave][i] == pytest.approx(valor)
+
+
+@pytest.mark.parametrize(
+    "precos, sls, sinais",
+    [
+        ([100.0], [95.0, 105.0], [1, -1]),
+        ([100.0, 100.0], 95.0, [1, -1]),
+        ([100.0, 100.0], [95.0, 105.0], [1, -1, 1]),
+    ],
+)
+def test_calcular_risco_vec_tamanhos_divergentes(bot, precos, sls, sinais):
+    assert bot.calcular_risco_vec(["BTCUSDT", "ETHUSDT"], precos, sls, sinais) == {}
@@ -0,0 +1,241 @@
+"""Testes do pipeline de log do GerenciadorLog (fila, dedup, rotação)."""
+
+import logging
+import sys
+import threading
+
+import pytest
+
+from plugins.gerenciadores.gerenciador_log import (
+    FastRotatingFileHandler,
+    _FilaLog,
+    _LazyDetails,
+    _LimiteTraceback,
+    _QueueHandlerTipo,
+    _QueueListenerDedup,
+)
+
+
+class _Captura(logging.Handler):
+    """Handler que apenas guarda os records recebidos."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def mensagens(self):
+        return [(r.levelno, r.getMessage()) for r in self.records]
+
+
+def _record(msg, nivel=logging.INFO, created=1000.0, nome="Plugin_system"):
+    return logging.makeLogRecord({
+        "name": nome,
+        "levelno": nivel,
+        "levelname": logging.getLevelName(nivel),
+        "msg": msg,
+        "created": created,
+        "tipo_log": "system",
+    })
+
+
+@pytest.fixture
+def listener():
+    captura = _Captura()
+    return _QueueListenerDedup(_FilaLog(maxsize=100), captura, janela=60.0), captura
+
+
+def test_repeticoes_suprimidas_e_resumo_na_proxima_mensagem(listener):
+    dedup, captura = listener
+    for i in range(4):
+        dedup.handle(_record("mesma", created=1000.0 + i))
+    dedup.handle(_record("outra", created=1010.0))
+
+    assert captura.mensagens() == [
+        (logging.INFO, "mesma"),
+        (logging.INFO, "Última mensagem repetida 3 vezes"),
+        (logging.INFO, "outra"),
+    ]
+
+
+def test_mesmo_texto_em_nivel_diferente_nao_e_suprimido(listener):
+    dedup, captura = listener
+    dedup.handle(_record("aviso", logging.INFO))
+    dedup.handle(_record("aviso", logging.WARNING, created=1001.0))
+
+    assert captura.mensagens() == [(logging.INFO, "aviso"), (logging.WARNING, "aviso")]
+
+
+@pytest.mark.parametrize("nivel", [logging.ERROR, logging.CRITICAL])
+def test_erros_nunca_sao_suprimidos(listener, nivel):
+    dedup, captura = listener
+    dedup.handle(_record("info", created=1000.0))
+    dedup.handle(_record("info", created=1001.0))
+    for i in range(3):
+        dedup.handle(_record("falhou", nivel, created=1002.0 + i))
+
+    assert captura.mensagens() == [
+        (logging.INFO, "info"),
+        (logging.INFO, "Última mensagem repetida 1 vezes"),
+        (nivel, "falhou"),
+        (nivel, "falhou"),
+        (nivel, "falhou"),
+    ]
+
+
+def test_resumo_emitido_quando_a_janela_expira(listener):
+    dedup, captura = listener
+    for i in range(3):
+        dedup.handle(_record("rajada", logging.WARNING, created=1000.0 + i))
+
+    dedup.emitir_resumos_expirados(1059.0)
+    assert len(captura.records) == 1
+
+    dedup.emitir_resumos_expirados(1060.0)
+    assert captura.mensagens()[-1] == (logging.WARNING, "Última mensagem repetida 2 vezes")
+
+    # Resumo já emitido não se repete
+    dedup.emitir_resumos_expirados(1200.0)
+    assert len(captura.records) == 2
+
+
+def test_stop_emite_resumos_pendentes():
+    captura = _Captura()
+    fila = _FilaLog(maxsize=100)
+    dedup = _QueueListenerDedup(fila, captura)
+    dedup.start()
+    for i in range(3):
+        fila.put(_record("pendente", created=1000.0 + i))
+    dedup.stop()
+
+    assert captura.mensagens() == [
+        (logging.INFO, "pendente"),
+        (logging.INFO, "Última mensagem repetida 2 vezes"),
+    ]
+
+
+def test_descartes_concorrentes_nao_se_perdem():
+    fila = _FilaLog(maxsize=1)
+    fila.put_nowait(_record("ocupa"))
+    handler = _QueueHandlerTipo(fila, "system")
+
+    def produzir():
+        for _ in range(2000):
+            handler.enqueue(_record("excedente"))
+
+    threads = [threading.Thread(target=produzir) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fila.coletar_descartados() == 16000
+    assert fila.descartados == 0
+
+
+def test_listener_reporta_descartes_quando_a_fila_esvazia(listener):
+    dedup, captura = listener
+    for _ in range(5):
+        dedup.queue.registrar_descarte()
+
+    dedup.handle(_record("normal"))
+
+    assert captura.mensagens() == [
+        (logging.WARNING, "5 registros de log descartados (fila cheia)"),
+        (logging.INFO, "normal"),
+    ]
+    assert dedup.queue.descartados == 0
+
+
+@pytest.fixture
+def arquivo_rotativo(tmp_path):
+    handler = FastRotatingFileHandler(
+        str(tmp_path / "system.log"), maxBytes=50, backupCount=2, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    yield handler, tmp_path / "system.log"
+    handler.close()
+
+
+def _ler(caminho):
+    return caminho.read_text(encoding="utf-8")
+
+
+def test_do_rollover_copia_para_backup_e_trunca(arquivo_rotativo):
+    handler, caminho = arquivo_rotativo
+    handler.emit(_record("primeira"))
+    handler.doRollover()
+    handler.emit(_record("segunda"))
+    handler.flush()
+
+    assert _ler(caminho.with_name("system.log.1")) == "primeira\n"
+    # O stream ativo continua aberto e escreve do início do arquivo truncado
+    assert _ler(caminho) == "segunda\n"
+
+
+def test_do_rollover_respeita_backup_count(arquivo_rotativo):
+    handler, caminho = arquivo_rotativo
+    for mensagem in ("a", "b", "c"):
+        handler.emit(_record(mensagem))
+        handler.doRollover()
+
+    assert _ler(caminho.with_name("system.log.1")) == "c\n"
+    assert _ler(caminho.with_name("system.log.2")) == "b\n"
+    assert not caminho.with_name("system.log.3").exists()
+    assert _ler(caminho) == ""
+
+
+def test_verificar_rotacao_so_rotaciona_ao_atingir_max_bytes(arquivo_rotativo):
+    handler, caminho = arquivo_rotativo
+    handler.emit(_record("curta"))
+    handler.flush()
+    handler.verificar_rotacao()
+    assert not caminho.with_name("system.log.1").exists()
+
+    handler.emit(_record("x" * 60))
+    handler.flush()
+    handler.verificar_rotacao()
+    assert _ler(caminho.with_name("system.log.1")) == "curta\n" + "x" * 60 + "\n"
+    assert _ler(caminho) == ""
+
+
+def test_detalhes_usam_o_estado_do_momento_do_log():
+    detalhes = {"par": "BTCUSDT", "preco": 100}
+    record = _record("Detalhes: %s")
+    record.args = (_LazyDetails(detalhes),)
+
+    # Chamador reaproveita o dict antes do listener formatar o record
+    detalhes["preco"] = 200
+    detalhes["extra"] = True
+
+    assert record.getMessage() == "Detalhes: par: BTCUSDT, preco: 100"
+
+
+def test_limite_traceback_concorrente_respeita_o_maximo():
+    limite = _LimiteTraceback(maximo=10, janela=60.0)
+    try:
+        raise RuntimeError("falha")
+    except RuntimeError:
+        exc_info = sys.exc_info()
+    barreira = threading.Barrier(8)
+    records = []
+
+    def logar():
+        barreira.wait()
+        for _ in range(50):
+            record = _record("erro", logging.CRITICAL)
+            record.exc_info = exc_info
+            limite.filter(record)
+            records.append(record)
+
+    threads = [threading.Thread(target=logar) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    com_traceback = [r for r in records if r.exc_info]
+    assert len(com_traceback) == 10
+    assert limite._suprimidos == len(records) - 10
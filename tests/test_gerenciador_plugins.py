@@ -0,0 +1,125 @@
+"""Testes da ordem de execução do GerenciadorPlugins."""
+
+import pytest
+
+from plugins.base_plugin import Plugin, TipoPlugin
+from plugins.gerenciadores.gerenciador_plugins import CicloDependenciaError, GerenciadorPlugins
+
+
+def _plugin(nome, dependencias=(), tipo=TipoPlugin.INDICADOR):
+    """Cria uma instância de plugin mínima com o nome e as dependências dados."""
+    def executar(self, dados_entrada=None):
+        return {"status": "ok", f"saida_{nome}": sorted(dados_entrada or {})}
+
+    classe = type(nome, (Plugin,), {"plugin_tipo": tipo, "executar": executar})
+    return classe(config={"plugin_dependencias": list(dependencias)})
+
+
+def _gerenciador(*plugins, config=None):
+    gerenciador = GerenciadorPlugins(config=config)
+    gerenciador.inicializar()
+    for plugin in plugins:
+        assert gerenciador.registrar_plugin(plugin)
+    return gerenciador
+
+
+def test_sem_dependencias_mantem_ordem_de_registro():
+    gerenciador = _gerenciador(_plugin("C"), _plugin("A"), _plugin("B"))
+    gerenciador._calcular_ordem_execucao()
+
+    assert gerenciador.ordem_execucao == ["C", "A", "B"]
+    assert gerenciador.niveis_execucao == [["C", "A", "B"]]
+
+
+def test_niveis_agrupam_plugins_sem_dependencia_entre_si():
+    gerenciador = _gerenciador(
+        _plugin("D", ["B", "C"]),
+        _plugin("B", ["A"]),
+        _plugin("A"),
+        _plugin("C", ["A"]),
+        _plugin("E"),
+        _plugin("F", ["Inexistente"]),
+    )
+    gerenciador._calcular_ordem_execucao()
+
+    # Entre prontos vale a ordem de registro: B e C (registrados antes) passam E e F
+    assert gerenciador.ordem_execucao == ["A", "B", "C", "D", "E", "F"]
+    assert gerenciador.niveis_execucao == [["A", "E", "F"], ["B", "C"], ["D"]]
+
+
+def test_niveis_ignoram_auxiliar_e_ia():
+    gerenciador = _gerenciador(
+        _plugin("A"),
+        _plugin("Aux", tipo=TipoPlugin.AUXILIAR),
+        _plugin("Ia", ["A"], tipo=TipoPlugin.IA),
+        _plugin("B", ["A"]),
+    )
+    gerenciador._calcular_ordem_execucao()
+
+    assert gerenciador.ordem_execucao == ["A", "Aux", "Ia", "B"]
+    assert gerenciador.niveis_execucao == [["A"], ["B"]]
+
+
+def test_dependencias_executam_antes_dos_dependentes():
+    gerenciador = _gerenciador(_plugin("C", ["B"]), _plugin("A"), _plugin("B", ["A"]))
+    gerenciador._calcular_ordem_execucao()
+
+    assert gerenciador.ordem_execucao == ["A", "B", "C"]
+
+
+def test_ciclo_levanta_erro_com_plugins_envolvidos():
+    gerenciador = _gerenciador(
+        _plugin("A"),
+        _plugin("B", ["C"]),
+        _plugin("C", ["B"]),
+        _plugin("D", ["C"]),
+    )
+
+    with pytest.raises(CicloDependenciaError) as erro:
+        gerenciador._calcular_ordem_execucao()
+
+    assert isinstance(erro.value, ValueError)
+    # Participantes do ciclo e quem depende deles, na ordem de registro
+    assert erro.value.plugins == ["B", "C", "D"]
+
+
+def test_dependencia_de_si_mesmo_nao_e_ciclo():
+    gerenciador = _gerenciador(_plugin("A", ["A"]), _plugin("B", ["A"]))
+    gerenciador._calcular_ordem_execucao()
+
+    assert gerenciador.niveis_execucao == [["A"], ["B"]]
+
+
+@pytest.mark.parametrize("paralelos", [False, True])
+def test_execucao_em_niveis_preserva_resultados(paralelos):
+    gerenciador = _gerenciador(
+        _plugin("A"),
+        _plugin("B", ["A"]),
+        _plugin("C", ["A"]),
+        _plugin("D", ["B", "C"]),
+        config={"processamento": {"plugins_paralelos": paralelos}},
+    )
+
+    resultado = gerenciador.executar_plugins({"entrada": 1})
+
+    assert resultado["plugins_executados"] == ["A", "B", "C", "D"]
+    assert resultado["total_erros"] == 0
+
+
+@pytest.mark.parametrize("paralelos", [False, True])
+def test_execucao_com_ciclo_usa_ordem_de_registro(paralelos):
+    gerenciador = _gerenciador(
+        _plugin("A"),
+        _plugin("B", ["C"]),
+        _plugin("C", ["B"]),
+        _plugin("D", ["A"]),
+        config={"processamento": {"plugins_paralelos": paralelos}},
+    )
+
+    for _ in range(2):
+        resultado = gerenciador.executar_plugins({"entrada": 1})
+
+        assert resultado["plugins_executados"] == ["A", "B", "C", "D"]
+        assert resultado["total_erros"] == 0
+    # Ciclo não é reavaliado a cada execução
+    assert not gerenciador._ordem_dirty
@@ -9,9 +9,9 @@ Inclui:
 
 import logging
 import sys
+import time
 from datetime import datetime
-from typing import Optional
-import pytz
+from typing import Optional, Tuple
 
 # ============================
 #   NOVO NÍVEL DE LOG: TRACE
@@ -45,112 +45,208 @@ COLORS = {
 }
 
 
+# ============================
+#   HORÁRIO LOCAL SEM DATETIME
+# ============================
+class HorarioFuso:
+    """
+    Formata timestamps em um fuso fixo usando time.strftime + offset em segundos.
+    
+    O offset é recalculado no máximo uma vez por hora (transições de horário
+    de verão ocorrem em hora cheia), evitando criar um datetime por record.
+    """
+    
+    __slots__ = ("tz", "_hora", "_offset")
+    
+    def __init__(self, tz):
+        """
+        Args:
+            tz: Timezone (zoneinfo.ZoneInfo)
+        """
+        self.tz = tz
+        self._hora = None
+        self._offset = 0
+    
+    def offset(self, created: float) -> int:
+        """
+        Args:
+            created: Timestamp (epoch)
+        
+        Returns:
+            int: Deslocamento do fuso em relação a UTC, em segundos
+        """
+        hora = int(created) // 3600
+        if hora != self._hora:
+            local = datetime.fromtimestamp(hora * 3600, self.tz)
+            self._offset = int(local.utcoffset().total_seconds())
+            self._hora = hora
+        return self._offset
+    
+    def formatar(self, created: float, datefmt: str) -> str:
+        """
+        Args:
+            created: Timestamp (epoch) do record
+            datefmt: Formato strftime
+        
+        Returns:
+            str: Data/hora no fuso configurado
+        """
+        if "%z" in datefmt or "%Z" in datefmt:
+            # gmtime não conhece o fuso: mantém o caminho com datetime
+            return datetime.fromtimestamp(created, self.tz).strftime(datefmt)
+        return time.strftime(datefmt, time.gmtime(created + self.offset(created)))
+
+
 # ============================
 #   FORMATADOR CUSTOM COM CORES
 # ============================
+def extrair_categoria(mensagem: str) -> Tuple[Optional[str], str]:
+    """
+    Separa a tag inicial [X] de uma mensagem de log.
+    
+    Args:
+        mensagem: Mensagem já renderizada
+    
+    Returns:
+        tuple: (conteúdo da tag ou None, mensagem sem a tag)
+    """
+    if mensagem.startswith("["):
+        fim = mensagem.find("]")
+        if fim > 0:
+            return mensagem[1:fim], mensagem[fim + 1:].strip()
+    return None, mensagem
+
+
+def anotar_categoria(record: logging.LogRecord, mensagem: Optional[str] = None):
+    """
+    Extrai, uma única vez por record, a categoria e o corpo da mensagem.
+    
+    Define `record.categoria` (tag inicial [X] ou a categoria explícita de
+    log_categoria; None se não houver) e `record.corpo` (mensagem sem a tag).
+    
+    Args:
+        record: Record a anotar
+        mensagem: Mensagem já renderizada (evita um novo getMessage)
+    """
+    if mensagem is None:
+        mensagem = record.getMessage()
+    categoria = getattr(record, "_categoria_log", None)
+    if categoria:
+        # Categoria armazenada diretamente no record (log_categoria)
+        if mensagem.startswith(f"[{categoria}]"):
+            mensagem = mensagem[len(categoria) + 2:].strip()
+    else:
+        categoria, mensagem = extrair_categoria(mensagem)
+    record.categoria = categoria
+    record.corpo = mensagem
+
+
+def categoria_sem_origem(record: logging.LogRecord) -> Tuple[Optional[str], str]:
+    """
+    Categoria e corpo no padrão dos loggers do GerenciadorLog.
+    
+    A 1ª tag da mensagem identifica a origem (redundante com o nome do
+    logger) e é descartada; uma 2ª tag, se houver (ex: [ERRO_CRITICO]), é a
+    categoria. Categoria explícita de log_categoria é usada como está.
+    
+    Args:
+        record: Record a analisar (anotado com anotar_categoria se preciso)
+    
+    Returns:
+        tuple: (categoria ou None, mensagem sem as tags)
+    """
+    if not hasattr(record, "corpo"):
+        anotar_categoria(record)
+    categoria, mensagem = record.categoria, record.corpo
+    if categoria is not None and not getattr(record, "_categoria_log", None):
+        categoria, mensagem = extrair_categoria(mensagem)
+    return categoria, mensagem
+
+
+def formatar_com_rotulo(formatter: logging.Formatter, record: logging.LogRecord, rotulo: str, mensagem: str) -> str:
+    """
+    Equivalente a Formatter.format, mas com %(levelname)s trocado pelo rótulo
+    e %(message)s pela mensagem informada (sem copiar nem alterar msg/args do record).
+    
+    Args:
+        formatter: Formatter (estilo %) cujo formato será usado
+        record: Record a formatar
+        rotulo: Texto exibido no lugar do nível
+        mensagem: Texto exibido como mensagem
+    
+    Returns:
+        str: Linha formatada
+    """
+    if formatter.usesTime():
+        record.asctime = formatter.formatTime(record, formatter.datefmt)
+    valores = dict(record.__dict__)
+    valores["levelname"] = rotulo
+    valores["message"] = mensagem
+    s = formatter._style._fmt % valores
+    if record.exc_info and not record.exc_text:
+        record.exc_text = formatter.formatException(record.exc_info)
+    if record.exc_text:
+        if s[-1:] != "\n":
+            s = s + "\n"
+        s = s + record.exc_text
+    if record.stack_info:
+        if s[-1:] != "\n":
+            s = s + "\n"
+        s = s + formatter.formatStack(record.stack_info)
+    return s
+
+
 class SmartFormatter(logging.Formatter):
     """
     Formatador customizado com cores ANSI para console.
     Integrado com o sistema existente (timezone BRT, arquivo:linha).
     """
     
-    def __init__(self, fmt=None, datefmt=None, timezone_sp=None, use_colors=True):
+    def __init__(self, fmt=None, datefmt=None, timezone_sp=None, use_colors=True, descartar_origem=False):
         """
         Inicializa o formatador.
         
         Args:
             fmt: Formato da mensagem
             datefmt: Formato da data
-            timezone_sp: Timezone de São Paulo (pytz)
+            timezone_sp: Timezone de São Paulo (zoneinfo.ZoneInfo)
             use_colors: Se deve usar cores ANSI (True para console, False para arquivo)
+            descartar_origem: Se a 1ª tag da mensagem é a origem e deve ser
+                descartada, como nos arquivos do GerenciadorLog (ver categoria_sem_origem)
         """
         super().__init__(fmt, datefmt)
         self.timezone_sp = timezone_sp
+        self._horario = HorarioFuso(timezone_sp) if timezone_sp else None
         self.use_colors = use_colors
+        self.descartar_origem = descartar_origem
+        # Decide cores uma vez (isatty é uma syscall; não precisa repetir a cada record)
+        self._aplicar_cores = use_colors and sys.stdout.isatty()
     
     def formatTime(self, record, datefmt=None):
         """Formata o tempo com timezone de São Paulo."""
-        if self.timezone_sp:
-            # Converte de UTC para timezone de São Paulo (mesma lógica do GerenciadorLog)
-            dt_utc = datetime.fromtimestamp(record.created, tz=pytz.UTC)
-            dt_sp = dt_utc.astimezone(self.timezone_sp)
-            if datefmt:
-                s = dt_sp.strftime(datefmt)
-            else:
-                s = dt_sp.strftime(self.default_time_format)
-            return s
+        if self._horario:
+            # Mesma lógica do GerenciadorLog: offset do fuso em cache + time.strftime
+            return self._horario.formatar(record.created, datefmt or self.default_time_format)
         return super().formatTime(record, datefmt)
     
     def format(self, record):
         """Formata a mensagem com cores se habilitado."""
-        # Verifica se a mensagem começa com [CATEGORIA] (ex: [CORE], [FILTRO])
-        # Se sim, substitui o nível de log pela categoria
-        # Estratégia: lê mensagem original ANTES de formatar
-        mensagem_original = None
-        try:
-            # Obtém mensagem original do record ANTES de formatar
-            if hasattr(record, 'msg'):
-                if isinstance(record.msg, str):
-                    mensagem_original = record.msg
-                elif record.args:
-                    # Se há args, a mensagem será formatada - precisamos processar depois
-                    mensagem_original = None
-                else:
-                    mensagem_original = str(record.msg)
-        except:
-            pass
-        
-        # Se não conseguiu, tenta getMessage() mas isso pode já ter processado
-        if not mensagem_original:
-            try:
-                mensagem_original = record.getMessage()
-            except:
-                mensagem_original = None
-        
-        categoria_extraida = None
-        
-        # Primeiro, verifica se a categoria foi armazenada diretamente no record
-        if hasattr(record, '_categoria_log') and record._categoria_log:
-            categoria_extraida = record._categoria_log
-            # Remove categoria da mensagem se estiver presente
-            if mensagem_original and isinstance(mensagem_original, str) and mensagem_original.startswith(f"[{categoria_extraida}]"):
-                mensagem_sem_categoria = mensagem_original[len(f"[{categoria_extraida}]"):].strip()
-                record.msg = mensagem_sem_categoria
-                record.args = ()
-        # Se não encontrou, tenta extrair da mensagem
-        elif mensagem_original and isinstance(mensagem_original, str) and mensagem_original.startswith("[") and "]" in mensagem_original:
-            fim_categoria = mensagem_original.find("]")
-            if fim_categoria > 0:
-                categoria_extraida = mensagem_original[1:fim_categoria]
-                # Remove categoria da mensagem para não aparecer duplicada
-                mensagem_sem_categoria = mensagem_original[fim_categoria + 1:].strip()
-                record.msg = mensagem_sem_categoria
-                record.args = ()
-        
-        # Formata normalmente
-        msg_formatada = super().format(record)
-        
-        # Se encontrou categoria, substitui [LEVEL] por [CATEGORIA] na mensagem formatada
-        if categoria_extraida:
-            level = record.levelname
-            # Substitui [LEVEL] por [CATEGORIA] no formato (apenas primeira ocorrência)
-            if f"[{level}]" in msg_formatada:
-                msg_formatada = msg_formatada.replace(f"[{level}]", f"[{categoria_extraida}]", 1)
+        # Se a mensagem começa com [CATEGORIA] (ex: [CORE], [FILTRO]),
+        # a categoria aparece no lugar do nível de log
+        if self.descartar_origem:
+            categoria, mensagem = categoria_sem_origem(record)
+        else:
+            if not hasattr(record, "corpo"):
+                anotar_categoria(record)
+            categoria, mensagem = record.categoria, record.corpo
+        rotulo = categoria or record.levelname
         
         # Adiciona cores apenas no console (não em arquivos)
-        if self.use_colors and sys.stdout.isatty():
-            # Usa categoria se disponível, senão usa level
-            nivel_para_cor = categoria_extraida if categoria_extraida else record.levelname
-            color = COLORS.get(nivel_para_cor, COLORS.get(record.levelname, COLORS["RESET"]))
-            reset = COLORS["RESET"]
-            
-            # Aplica cor ao nível/categoria na mensagem
-            if categoria_extraida and f"[{categoria_extraida}]" in msg_formatada:
-                msg_formatada = msg_formatada.replace(f"[{categoria_extraida}]", f"{color}[{categoria_extraida}]{reset}", 1)
-            elif f"[{record.levelname}]" in msg_formatada:
-                msg_formatada = msg_formatada.replace(f"[{record.levelname}]", f"{color}[{record.levelname}]{reset}", 1)
+        if self._aplicar_cores:
+            color = COLORS.get(rotulo, COLORS.get(record.levelname, COLORS["RESET"]))
+            rotulo = f"{color}{rotulo}{COLORS['RESET']}"
         
-        return msg_formatada
+        return formatar_com_rotulo(self, record, rotulo, mensagem)
 
 
 # ============================
@@ -215,7 +311,7 @@ def criar_logger_com_cores(
     Args:
         component: Nome do componente
         level: Nível de log (INFO, DEBUG, TRACE, etc.)
-        timezone_sp: Timezone de São Paulo (pytz.timezone)
+        timezone_sp: Timezone de São Paulo (zoneinfo.ZoneInfo)
         formato: Formato customizado (opcional)
     
     Returns:
@@ -251,9 +347,9 @@ def criar_logger_com_cores(
 """
 # Uso básico (standalone)
 from utils.log_helper import criar_logger_com_cores
-import pytz
+from zoneinfo import ZoneInfo
 
-logger = criar_logger_com_cores("DOTUSDT | EMA", level="DEBUG", timezone_sp=pytz.timezone('America/Sao_Paulo'))
+logger = criar_logger_com_cores("DOTUSDT | EMA", level="DEBUG", timezone_sp=ZoneInfo('America/Sao_Paulo'))
 
 logger.info("Iniciando execução do indicador EMA")
 logger.debug("EMA(20)=7.12 / EMA(50)=7.09 — cruzamento detectado")
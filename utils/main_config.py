@@ -340,6 +340,10 @@ class ConfigManager:
                 # O número de workers é calculado dinamicamente: max(1, pares // 3)
                 # Mantido aqui apenas para compatibilidade com outros plugins que possam usar
                 "max_workers_paralelo": int(os.getenv("PROCESSAMENTO_MAX_WORKERS", "3")),  # Workers paralelos (não usado pelo PluginDadosVelas)
+                # GerenciadorPlugins: executa em paralelo plugins do mesmo nível de dependências.
+                # Desligado: plugins sem "plugin_dependencias" dependem da ordem de registro
+                # (cada um recebe os dados dos anteriores)
+                "plugins_paralelos": False,
             },
             
             # Configurações de trading